@@ -0,0 +1,72 @@
+"""
+Objects per second of every installed JSON decoder, and of keyword argument against from_dict model construction.
+
+    python benchmarks/bench_decode.py --per-page 80 --rounds 200
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from Pexels.decoders import DECODERS, get_decoder
+from Pexels.errors import PexelsError
+from Pexels.types import Photo, PhotoResponse, Src, Video, VideoFiles, VideoPicture, VideoResponse
+
+from fixtures import photo_json, photo_page, video_json, video_page
+
+
+def best_rate(call: Callable[[], object], objects: int, rounds: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            call()
+        best = min(best, time.perf_counter() - started)
+    return objects * rounds / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=80)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = [
+        ("photo", PhotoResponse, json.dumps(photo_page(1, args.per_page)).encode()),
+        ("video", VideoResponse, json.dumps(video_page(1, args.per_page)).encode()),
+    ]
+
+    print("decode + build of result pages, objects/s")
+    print(f"{'decoder':<10}{'build':<12}" + "".join(f"{name:>12}" for name, _, _ in pages))
+    for name in DECODERS:
+        try:
+            decode = get_decoder(name)
+        except PexelsError:
+            print(f"{name:<10}not installed")
+            continue
+        for label in ("kwargs", "from_dict"):
+            rates = [
+                best_rate(
+                    (lambda: model(**decode(body))) if label == "kwargs" else (lambda: model.from_dict(decode(body))),
+                    args.per_page, args.rounds
+                )
+                for _, model, body in pages
+            ]
+            print(f"{name:<10}{label:<12}" + "".join(f"{rate:12.0f}" for rate in rates))
+
+    print("\nsingle model construction, objects/s")
+    video = video_json(1)
+    models = [
+        (Src, photo_json(1)["src"]), (Photo, photo_json(1)), (VideoFiles, video["video_files"][0]),
+        (VideoPicture, video["video_pictures"][0]), (Video, video),
+    ]
+    print(f"{'model':<14}{'kwargs':>12}{'from_dict':>12}")
+    for model, data in models:
+        kwargs = best_rate(lambda: model(**data), 1, args.rounds * 50)
+        from_dict = best_rate(lambda: model.from_dict(data), 1, args.rounds * 50)
+        print(f"{model.__name__:<14}{kwargs:12.0f}{from_dict:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Single stream against segmented range downloads, from a local server limiting every connection's bandwidth.
+
+    python benchmarks/bench_download.py --size-mb 64 --segments 8 --rate-mb 16
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from Pexels.download import download
+
+
+def make_handler(blob: bytes, rate: float, ranges: bool = True):
+
+    class RangeHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(blob)))
+            if ranges:
+                self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+
+        def do_GET(self):
+            start, end = 0, len(blob) - 1
+            header = self.headers.get("Range")
+            if ranges and header:
+                first, last = header.replace("bytes=", "").split("-")
+                start, end = int(first), int(last) if last else len(blob) - 1
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(blob)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+
+            # every connection is throttled to `rate` bytes per second, like a single CDN stream
+            chunk = 64 * 1024
+            for offset in range(start, end + 1, chunk):
+                self.wfile.write(blob[offset:min(offset + chunk, end + 1)])
+                time.sleep(chunk / rate)
+
+    return RangeHandler
+
+
+def timed_download(url: str, dest: str, segments: int) -> float:
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=segments)
+    session.mount("http://", adapter)
+    started = time.perf_counter()
+    download(session, url, dest, segments=segments)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--rate-mb", type=float, default=16, help="bandwidth of one connection in MB/s")
+    args = parser.parse_args()
+
+    blob = os.urandom(args.size_mb * 1024 * 1024)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(blob, args.rate_mb * 1024 * 1024))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/video.mp4"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for segments in (1, args.segments):
+            dest = os.path.join(tmp, f"video-{segments}.mp4")
+            elapsed = timed_download(url, dest, segments)
+            with open(dest, "rb") as file:
+                assert file.read() == blob, "downloaded file differs"
+            print(f"segments={segments:<3} {elapsed:6.2f}s {args.size_mb / elapsed:8.1f} MB/s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
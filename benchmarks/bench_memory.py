@@ -0,0 +1,91 @@
+"""
+Bytes per model object, measured with tracemalloc, against a baseline of the same models
+storing their attributes in a per-instance __dict__, as they did before __slots__.
+
+    python benchmarks/bench_memory.py --count 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict
+
+from Pexels.types import Photo, Src, User, Video, VideoFiles, VideoPicture
+
+from fixtures import photo_json, video_json
+
+
+class DictModel:
+    """A model without __slots__, every field of `fields` set in order so instances share their dict keys."""
+
+    fields = ()
+    nested: Dict[str, type] = {}
+
+    def __init__(self, **data):
+        for name in self.fields:
+            value = data.get(name)
+            factory = self.nested.get(name)
+            if factory is not None:
+                value = [factory(**item) for item in value] if isinstance(value, list) else factory(**value)
+            setattr(self, name, value)
+
+
+def dict_model(model: type, **nested: type) -> type:
+    # the public fields of a slotted model, a private slot only counts when it backs a property
+    fields = [
+        name.lstrip('_') for name in model.__slots__
+        if not name.startswith('_') or isinstance(getattr(model, name.lstrip('_'), None), property)
+    ]
+    return type(f"Dict{model.__name__}", (DictModel,), {'fields': fields, 'nested': nested})
+
+
+def baseline_models() -> Dict[str, type]:
+    return {
+        'photo': dict_model(Photo, src=dict_model(Src)),
+        'video': dict_model(
+            Video, video_files=dict_model(VideoFiles), video_pictures=dict_model(VideoPicture)
+        ),
+    }
+
+
+def bytes_per_object(factory, payloads) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(**payload) for payload in payloads]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(objects)
+    del objects
+    return current / count
+
+
+def run(count: int) -> dict:
+    # the payload strings are shared by every object, only the model overhead is measured
+    photo = photo_json(1)
+    video = video_json(1)
+    baseline = baseline_models()
+    videos = max(count // 100, 1)
+    return {
+        'photo_bytes': bytes_per_object(Photo, [photo] * count),
+        'video_bytes': bytes_per_object(Video, [video] * videos),
+        'baseline_photo_bytes': bytes_per_object(baseline['photo'], [photo] * count),
+        'baseline_video_bytes': bytes_per_object(baseline['video'], [video] * videos),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    result = run(args.count)
+    for name in ('photo', 'video'):
+        before, after = result[f'baseline_{name}_bytes'], result[f'{name}_bytes']
+        print(
+            f"{name.capitalize()}: {before:.0f} -> {after:.0f} bytes/object ({1 - after / before:.0%} saved), "
+            f"{before * args.count / 2**20:.0f} -> {after * args.count / 2**20:.0f} MiB for {args.count}"
+        )
+
+
+if __name__ == '__main__':
+    main()
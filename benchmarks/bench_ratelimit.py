@@ -0,0 +1,54 @@
+"""
+Concurrency check of the RateLimiter around an exhausted budget: no request may be released before
+the reset time, and the update() of a response must not wait for the threads sleeping until then.
+
+    python benchmarks/bench_ratelimit.py --threads 16 --burst 5 --reset 2
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Pexels import RateLimiter
+
+
+def headers(remaining: int, reset: float) -> dict:
+    return {"X-Ratelimit-Limit": "20000", "X-Ratelimit-Remaining": str(remaining), "X-Ratelimit-Reset": str(reset)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--burst", type=int, default=5)
+    parser.add_argument("--reset", type=float, default=2.0, help="seconds until the reset of the exhausted budget")
+    args = parser.parse_args()
+
+    limiter = RateLimiter(burst=args.burst)
+    reset = time.time() + args.reset
+    limiter.update(headers(0, reset))
+    barrier = threading.Barrier(args.threads)
+
+    def call(n: int) -> float:
+        barrier.wait()
+        limiter.acquire()
+        return time.time()
+
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        futures = [executor.submit(call, n) for n in range(args.threads)]
+        time.sleep(args.reset / 4)
+        started = time.perf_counter()
+        limiter.update(headers(0, reset))
+        blocked = time.perf_counter() - started
+        released = sorted(future.result() - reset for future in futures)
+
+    early = [offset for offset in released if offset < -0.01]
+    print(f"released relative to reset: first {released[0]:+.3f}s, last {released[-1]:+.3f}s")
+    print(f"update() blocked for {blocked * 1000:.2f} ms")
+    assert not early, f"{len(early)} of {args.threads} requests released before the reset"
+    assert blocked < 0.1, f"update() blocked for {blocked:.2f}s by a sleeping acquire()"
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Whole page against streamed page parsing: time to the first item, total time and peak memory.
+
+    python benchmarks/bench_streaming.py --per-page 80 --bandwidth-mb 8
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable
+
+from Pexels import Client
+
+from mock_server import MockPexels
+
+
+def timing(pages: Callable[[], Iterable], repeat: int) -> Dict[str, float]:
+    first = total = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        first_item = None
+        for video in pages():
+            if first_item is None:
+                first_item = time.perf_counter() - started
+        first = min(first, first_item)
+        total = min(total, time.perf_counter() - started)
+    return {'first_ms': first * 1000, 'total_ms': total * 1000}
+
+
+def peak_memory(pages: Callable[[], Iterable]) -> float:
+    # tracemalloc slows allocations down, so it is measured apart from the timings
+    tracemalloc.start()
+    for video in pages():
+        pass
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=80)
+    parser.add_argument("--bandwidth-mb", type=float, default=8, help="bandwidth of the connection in MB/s, 0 for unlimited")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with MockPexels(bandwidth=args.bandwidth_mb * 1024 * 1024) as server:
+        with Client("token", base_endpoint=server.base_endpoint, video_endpoint=server.video_endpoint) as client:
+            cases = [
+                ("whole", lambda: client.search_videos("nature", per_page=args.per_page).videos),
+                ("stream", lambda: client.stream_search_videos("nature", per_page=args.per_page)),
+            ]
+            # the mock server builds and caches the body on the first request, in this process
+            for label, pages in cases:
+                list(pages())
+
+            print(f"{'':<8}{'first item':>12}{'total':>12}{'peak memory':>16}")
+            for label, pages in cases:
+                result = timing(pages, args.repeat)
+                peak = peak_memory(pages)
+                print(f"{label:<8}{result['first_ms']:10.1f}ms{result['total_ms']:10.1f}ms{peak:12.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
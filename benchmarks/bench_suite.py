@@ -0,0 +1,208 @@
+"""
+Benchmark suite of the client against the local mock server, stored per commit to spot regressions.
+
+    python benchmarks/bench_suite.py --latency 0.002 --threads 16
+    python benchmarks/bench_suite.py --compare benchmarks/results/4cdf8fc.json
+
+Every run writes benchmarks/results/<commit>.json and compares it with the previous result found there.
+Throughputs are higher-is-better, latencies and memory are lower-is-better.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from Pexels import Client
+from Pexels.decoders import get_decoder
+from Pexels.types import CollectionMediaResponse, PhotoResponse, VideoResponse
+
+from fixtures import collection_media_page, photo_page, video_page
+from mock_server import MockPexels
+
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+LOWER_IS_BETTER = ("_ms", "_bytes")
+
+
+def percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
+
+
+def latency_stats(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def timed(call: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    call()
+    return time.perf_counter() - started
+
+
+def sequential(client: Client, requests: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    latencies = [timed(lambda: client.get_photo(n % 500 + 1)) for n in range(requests)]
+    return latency_stats(latencies, time.perf_counter() - started)
+
+
+def threaded(client: Client, requests: int, threads: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = list(executor.map(lambda n: timed(lambda: client.get_photo(n % 500 + 1)), range(requests)))
+    return latency_stats(latencies, time.perf_counter() - started)
+
+
+def pagination(client: Client, per_page: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    count = sum(1 for photo in client.iter_search_photos("nature", per_page=per_page))
+    elapsed = time.perf_counter() - started
+    return {"photos_per_s": count / elapsed, "pages_per_s": count / per_page / elapsed}
+
+
+def decode_build(per_page: int, rounds: int) -> Dict[str, float]:
+    # decoding and model building without the network, the JSON bodies are prepared once
+    result = {}
+    loads = get_decoder()
+    cases = [
+        ("photo", PhotoResponse, json.dumps(photo_page(1, per_page)).encode()),
+        ("video", VideoResponse, json.dumps(video_page(1, per_page)).encode()),
+        ("collection_media", CollectionMediaResponse, json.dumps(collection_media_page(1, per_page)).encode()),
+    ]
+    for name, model, body in cases:
+        decode = build = 0.0
+        for _ in range(rounds):
+            started = time.perf_counter()
+            data = loads(body)
+            decoded = time.perf_counter()
+            model.from_dict(data)
+            build += time.perf_counter() - decoded
+            decode += decoded - started
+        objects = per_page * rounds
+        result[f"{name}_decode_objects_per_s"] = objects / decode
+        result[f"{name}_build_objects_per_s"] = objects / build
+        result[f"{name}_objects_per_s"] = objects / (decode + build)
+    return result
+
+
+def memory(count: int = 10000) -> Dict[str, float]:
+    # peak traced memory of decoding and building `count` objects from 80-item pages
+    result = {}
+    loads = get_decoder()
+    for name, model, page in (("photo", PhotoResponse, photo_page), ("video", VideoResponse, video_page)):
+        bodies = [json.dumps(page(n + 1, 80, count)).encode() for n in range(count // 80 + 1)]
+        gc.collect()
+        tracemalloc.start()
+        responses = [model.from_dict(loads(body)) for body in bodies]
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del responses
+        result[f"{name}_peak_bytes_per_10k"] = peak * 10000 / count
+    return result
+
+
+def commit() -> str:
+    try:
+        head = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+        dirty = subprocess.check_output(["git", "status", "--porcelain", "--", "src"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{head}-dirty" if dirty else head
+
+
+def previous_result(exclude: Optional[str]) -> Optional[Dict]:
+    if not os.path.isdir(RESULTS):
+        return None
+    files = [
+        os.path.join(RESULTS, name) for name in sorted(os.listdir(RESULTS))
+        if name.endswith(".json") and name != f"{exclude}.json"
+    ]
+    results = []
+    for path in files:
+        with open(path) as file:
+            results.append(json.load(file))
+    return max(results, key=lambda result: result["timestamp"], default=None)
+
+
+def compare(current: Dict, previous: Dict, threshold: float) -> List[str]:
+    regressions = []
+    print(f"\ncompared with {previous['commit']}:")
+    for group, metrics in current["results"].items():
+        for name, value in metrics.items():
+            before = previous["results"].get(group, {}).get(name)
+            if not before:
+                continue
+            change = (value - before) / before
+            worse = change > threshold if name.endswith(LOWER_IS_BETTER) else change < -threshold
+            flag = "  REGRESSION" if worse else ""
+            print(f"  {group}.{name:<36} {before:14.1f} -> {value:14.1f} {change:+7.1%}{flag}")
+            if worse:
+                regressions.append(f"{group}.{name}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds the mock server waits per request")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--per-page", type=int, default=80, help="payload size of the paginated endpoints")
+    parser.add_argument("--renditions", type=int, default=10, help="video_files per video in the payloads")
+    parser.add_argument("--total-results", type=int, default=4000)
+    parser.add_argument("--rounds", type=int, default=50, help="pages decoded and built per model")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change reported as a regression")
+    parser.add_argument("--compare", help="result file to compare with, default: the latest other result")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    with MockPexels(latency=args.latency, total_results=args.total_results, renditions=args.renditions) as server:
+        with Client(
+            "token", base_endpoint=server.base_endpoint, video_endpoint=server.video_endpoint, pool_size=args.threads
+        ) as client:
+            client.get_photo(1)
+            results["sequential"] = sequential(client, args.requests)
+            results["threaded"] = threaded(client, args.requests, args.threads)
+            results["pagination"] = pagination(client, args.per_page)
+    results["decode_build"] = decode_build(args.per_page, args.rounds)
+    results["memory"] = memory()
+
+    current = {
+        "commit": commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": vars(args),
+        "results": results,
+    }
+    for group, metrics in results.items():
+        for name, value in metrics.items():
+            print(f"{group}.{name:<36} {value:14.1f}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+    else:
+        previous = previous_result(None if args.no_save else current["commit"])
+    if previous is not None:
+        compare(current, previous, args.threshold)
+
+    if not args.no_save:
+        os.makedirs(RESULTS, exist_ok=True)
+        path = os.path.join(RESULTS, f"{current['commit']}.json")
+        with open(path, "w") as file:
+            json.dump(current, file, indent=2)
+        print(f"\nsaved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Stress test of one Client shared by many threads, against the local mock server.
+Every response is checked against its request and the number of upstream calls is verified.
+
+    python benchmarks/bench_threads.py --threads 32 --requests 2000
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Pexels import Client, ResponseCache
+
+from mock_server import MockPexels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    with MockPexels(latency=args.latency) as server:
+        client = Client(
+            "token",
+            base_endpoint=server.base_endpoint,
+            video_endpoint=server.video_endpoint,
+            pool_size=args.threads,
+            cache=ResponseCache(max_entries=100),
+            coalesce=True,
+        )
+
+        def call(n: int) -> None:
+            # a few hundred distinct ids, so the cache and coalescing are exercised along with the network
+            photo_id = n % 300 + 1
+            photo = client.get_photo(photo_id)
+            assert photo.id == photo_id, f"got photo {photo.id} for {photo_id}"
+            page = n % 5 + 1
+            response = client.search_photos("nature", page=page, per_page=10)
+            assert response.page == page and response.photos[0].id == (page - 1) * 10 + 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            list(executor.map(call, range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+        stats = client.cache.stats()
+        calls = args.requests * 2
+        assert stats["hits"] + stats["misses"] == calls, stats
+        assert server.requests == stats["misses"] - client.coalesced_requests, (server.requests, stats)
+        print(f"{calls} calls from {args.threads} threads in {elapsed:.2f}s ({calls / elapsed:.0f} calls/s)")
+        print(f"upstream requests: {server.requests}, cache: {stats}, coalesced: {client.coalesced_requests}")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
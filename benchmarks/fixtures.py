@@ -0,0 +1,99 @@
+"""Realistic Pexels API payloads used by the benchmarks"""
+
+from typing import Any, Dict, List
+
+COLORS = ['#978E82', '#2E3A3F', '#A7A6A4', '#5D4F3F', '#C4B9A8', '#1F2B36', '#8A9A5B', '#D3C4B1']
+
+
+def photo_json(id: int) -> Dict[str, Any]:
+    original = f"https://images.pexels.com/photos/{id}/pexels-photo-{id}.jpeg"
+    return {
+        "id": id,
+        "width": 3000 + id % 2000,
+        "height": 2000 + id % 3000,
+        "url": f"https://www.pexels.com/photo/brown-rocks-during-golden-hour-{id}/",
+        "photographer": "Joey Farina",
+        "photographer_url": "https://www.pexels.com/@joey",
+        "photographer_id": 680589 + id % 5000,
+        "avg_color": COLORS[id % len(COLORS)],
+        "src": {
+            "original": original,
+            "large2x": f"{original}?auto=compress&cs=tinysrgb&dpr=2&h=650&w=940",
+            "large": f"{original}?auto=compress&cs=tinysrgb&h=650&w=940",
+            "medium": f"{original}?auto=compress&cs=tinysrgb&h=350",
+            "small": f"{original}?auto=compress&cs=tinysrgb&h=130",
+            "portrait": f"{original}?auto=compress&cs=tinysrgb&fit=crop&h=1200&w=800",
+            "landscape": f"{original}?auto=compress&cs=tinysrgb&fit=crop&h=627&w=1200",
+            "tiny": f"{original}?auto=compress&cs=tinysrgb&dpr=1&fit=crop&h=200&w=280",
+        },
+        "liked": False,
+        "alt": "Brown Rocks During Golden Hour",
+    }
+
+
+def video_json(id: int, renditions: int = 10) -> Dict[str, Any]:
+    sizes = [(640, 360, 'sd'), (960, 540, 'sd'), (1280, 720, 'hd'), (1920, 1080, 'hd'), (2560, 1440, 'hd'), (3840, 2160, 'uhd')]
+    return {
+        "id": id,
+        "width": 3840,
+        "height": 2160,
+        "url": f"https://www.pexels.com/video/video-of-forest-{id}/",
+        "image": f"https://images.pexels.com/videos/{id}/free-video-{id}.jpg?fit=crop&w=1200&h=630&auto=compress&cs=tinysrgb",
+        "duration": 5 + id % 60,
+        "user": {"id": 290887, "name": "Ruvim Miksanskiy", "url": "https://www.pexels.com/@digitech"},
+        "video_files": [
+            {
+                "id": id * 100 + n,
+                "quality": sizes[n % len(sizes)][2],
+                "file_type": "video/mp4",
+                "width": sizes[n % len(sizes)][0],
+                "height": sizes[n % len(sizes)][1],
+                "link": f"https://player.vimeo.com/external/{id}.{sizes[n % len(sizes)][2]}.mp4?s=1&profile_id={n}",
+            }
+            for n in range(renditions)
+        ],
+        "video_pictures": [
+            {"id": id * 100 + n, "picture": f"https://images.pexels.com/videos/{id}/pictures/preview-{n}.jpg", "nr": n}
+            for n in range(15)
+        ],
+    }
+
+
+def photo_page(page: int = 1, per_page: int = 80, total_results: int = 8000) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    data = {
+        "page": page,
+        "per_page": per_page,
+        "photos": [photo_json(start + n + 1) for n in range(per_page)],
+        "total_results": total_results,
+    }
+    if start + per_page < total_results:
+        data["next_page"] = f"/v1/search/?page={page + 1}&per_page={per_page}&query=nature"
+    return data
+
+
+def video_page(page: int = 1, per_page: int = 80, total_results: int = 8000) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    data = {
+        "page": page,
+        "per_page": per_page,
+        "videos": [video_json(start + n + 1) for n in range(per_page)],
+        "total_results": total_results,
+        "url": "https://www.pexels.com/search/videos/nature/",
+    }
+    if start + per_page < total_results:
+        data["next_page"] = f"/videos/search/?page={page + 1}&per_page={per_page}&query=nature"
+    return data
+
+
+def collection_media_page(page: int = 1, per_page: int = 80, total_results: int = 8000) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    media: List[Dict[str, Any]] = []
+    for n in range(per_page):
+        item = photo_json(start + n + 1) if n % 2 else video_json(start + n + 1)
+        item["type"] = "Photo" if n % 2 else "Video"
+        media.append(item)
+    data = {"id": "9mp14cx", "page": page, "per_page": per_page, "media": media, "total_results": total_results}
+    if start + per_page < total_results:
+        data["next_page"] = f"/v1/collections/9mp14cx?page={page + 1}&per_page={per_page}"
+    return data
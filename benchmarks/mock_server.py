@@ -0,0 +1,148 @@
+"""
+A local HTTP server answering like the Pexels API, with realistic payloads and configurable latency.
+
+    with MockPexels(latency=0.05) as server:
+        client = Client("token", base_endpoint=server.base_endpoint, video_endpoint=server.video_endpoint)
+"""
+
+import json
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from fixtures import collection_media_page, photo_json, photo_page, video_json, video_page
+
+
+class MockPexels:
+    """
+    Args:
+        latency (float): Seconds waited before every answer.
+        total_results (int): The number of results of every paginated endpoint.
+        renditions (int): The number of `video_files` of every video.
+        bandwidth (float): Bytes per second sent to every connection, unlimited when 0.
+    """
+
+    def __init__(self, latency: float = 0.0, total_results: int = 8000, renditions: int = 10, bandwidth: float = 0):
+
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.total_results = total_results
+        self.renditions = renditions
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 256
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def base_endpoint(self) -> str:
+        return f"{self.url}/v1/"
+
+    @property
+    def video_endpoint(self) -> str:
+        return f"{self.url}/videos"
+
+    def start(self) -> "MockPexels":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockPexels":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def body(self, path: str, query: dict) -> Optional[bytes]:
+        return _body(self.url, path, tuple(sorted(query.items())), self.total_results, self.renditions)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are separate writes, without this a delayed ACK adds 40ms to every keep-alive answer
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server._count()
+                split = urlsplit(self.path)
+                path = "/".join(segment for segment in split.path.split("/") if segment)
+                query = {key: values[-1] for key, values in parse_qs(split.query).items()}
+                body = server.body(path, query)
+                if server.latency:
+                    time.sleep(server.latency)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-Ratelimit-Limit", "20000")
+                self.send_header("X-Ratelimit-Remaining", "19999")
+                self.send_header("X-Ratelimit-Reset", str(int(time.time()) + 3600))
+                self.end_headers()
+                if not server.bandwidth:
+                    self.wfile.write(body)
+                    return
+                chunk = 16 * 1024
+                for offset in range(0, len(body), chunk):
+                    self.wfile.write(body[offset:offset + chunk])
+                    time.sleep(chunk / server.bandwidth)
+
+        return Handler
+
+
+@lru_cache(maxsize=512)
+def _body(url: str, path: str, query: tuple, total_results: int, renditions: int) -> Optional[bytes]:
+    query = dict(query)
+    page = int(query.get("page", 1))
+    per_page = int(query.get("per_page", 15))
+    segments = path.split("/")
+
+    if path in ("v1/search", "v1/curated"):
+        data = photo_page(page, per_page, total_results)
+    elif path in ("videos/search", "videos/popular"):
+        data = video_page(page, per_page, total_results)
+    elif path in ("v1/collections", "v1/collections/featured"):
+        data = {
+            "collections": [
+                {"id": f"c{n}", "title": "Nature", "description": "", "private": False,
+                 "media_count": 40, "photos_count": 30, "videos_count": 10}
+                for n in range((page - 1) * per_page, min(page * per_page, total_results))
+            ],
+            "page": page, "per_page": per_page, "total_results": total_results,
+        }
+    elif len(segments) == 3 and segments[:2] == ["v1", "photos"]:
+        return json.dumps(photo_json(int(segments[2]))).encode()
+    elif len(segments) == 3 and segments[:2] == ["videos", "videos"]:
+        return json.dumps(video_json(int(segments[2]), renditions)).encode()
+    elif len(segments) == 3 and segments[:2] == ["v1", "collections"]:
+        data = collection_media_page(page, per_page, total_results)
+    else:
+        return None
+
+    if page * per_page < total_results:
+        data["next_page"] = f"{url}/{path}/?{urlencode({**query, 'page': page + 1})}"
+    return json.dumps(data).encode()
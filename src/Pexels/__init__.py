@@ -1,6 +1,17 @@
 """A unofficial python wrapper library for Pexels API"""
 
 from .client import Client
+from .async_client import AsyncClient
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .hedge import HedgePolicy
+from .metrics import Metrics
+from .cache import DiskCache, ResponseCache
+from .decoders import get_decoder
+from .download import DownloadManager
+from .index import LocalIndex
+from .sync import FeedSync
+from .columnar import photo_columns, video_columns, video_file_columns
 from .errors import APIError, InvalidTokenError, QuotaExceedError
 from .errors import PexelsError, APIError, QuotaExceedError, InvalidTokenError
 from .constants import COLOR, ORIENTATION, SIZE, LOCALE_SUPPORTED
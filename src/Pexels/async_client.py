@@ -0,0 +1,388 @@
+"""
+AsyncClient class for the Pexels Unofficial API Wrapper
+Author: Joker Hacker
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from Pexels.client import _check_color, _check_locale, _check_orientation, _check_per_page, _check_size
+from Pexels.decoders import get_decoder
+from Pexels.errors import PexelsError, QuotaExceedError
+from Pexels.types import CollectionMediaResponse, CollectionResponse, Photo, PhotoResponse, Video, VideoResponse
+
+
+class AsyncClient:
+    """
+    This object represents an asyncio version of :class:`Pexels.client.Client`.
+
+    It exposes the same methods with the same validation and return types, but every method
+    is a coroutine and all requests share one pooled :mod:`aiohttp` connection.
+
+    .. code:: python
+
+        async with AsyncClient(token="abcde12345") as client:
+            photos = await client.search_photos("Nature")
+
+    Note:
+        * Requires the optional :mod:`aiohttp` dependency, ``pip install python-pexels[async]``.
+
+        * The connection pool is opened on the first request, inside the running event loop.
+        Use ``async with`` or call :meth:`close` to release it.
+
+    Args:
+        token (:obj:`str`): Unique authentication token.
+        base_endpoint (:obj:`str`, optional): Base endpoint of the API,
+            defaults to https://api.pexels.com/v1/
+        video_endpoint (:obj:`str`, optional): Video endpoint of the API,
+            defaults to https://api.pexels.com/videos
+        limit (:obj:`int`, optional): Maximum number of simultaneous connections in the pool. Default: 100
+        limit_per_host (:obj:`int`, optional): Maximum number of simultaneous connections to one host,
+            0 means no per host limit. Default: 0
+        json_decoder (:obj:`str` or :obj:`Callable`, optional): The name of a decoder from
+            :obj:`Pexels.decoders.DECODERS` or a function decoding :obj:`bytes`.
+            Default: the fastest installed one, see :func:`Pexels.decoders.get_decoder`
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_endpoint: str = "https://api.pexels.com/v1/",
+        video_endpoint: str = "https://api.pexels.com/videos",
+        limit: int = 100,
+        limit_per_host: int = 0,
+        json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None
+    ):
+
+        if aiohttp is None:
+            raise PexelsError("AsyncClient requires aiohttp, install it using pip install python-pexels[async]")
+
+        self._base_endpoint = base_endpoint
+        self._video_endpoint = video_endpoint
+        self._token = token
+        self._header = {'Authorization': self._token}
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._decode = json_decoder if callable(json_decoder) else get_decoder(json_decoder)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+            self.session = aiohttp.ClientSession(connector=connector, headers=self._header)
+        return self.session
+
+    async def _make_request(
+        self,
+        path: str,
+        search_type: str,
+        method: str = "get",
+        query: Dict = {},
+        **kwargs: Dict[Any, Any]
+    ) -> Tuple[Union[Dict, str], "aiohttp.ClientResponse"]:
+
+        if search_type == 'photo':
+            endpoint = self._base_endpoint
+        elif search_type == 'video':
+            endpoint = self._video_endpoint
+        else:
+            raise PexelsError("Invalid parameter search_type given")
+
+        # aiohttp refuses None values in query strings, requests silently drops them.
+        params = {key: value for key, value in query.items() if value is not None}
+
+        async with self._get_session().request(method, f'{endpoint}/{path}', params=params, **kwargs) as req:
+            if req.status in [200, 201]:
+                body = await req.read()
+                try:
+                    return self._decode(body), req
+                except ValueError:
+                    return await req.text(), req
+            elif req.status == 400:
+                raise PexelsError("Bad Request Caught")
+            elif req.status == 429:
+                raise QuotaExceedError("You have exceeded your rate limit.")
+            else:
+                raise PexelsError(f"{req.status} : {req.reason}")
+
+    async def search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = "",
+        size: Optional[str] = "",
+        color: Optional[str] = "",
+        locale: Optional[str] = "",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        **kwargs
+    ) -> PhotoResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.search_photos`.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired photo orientation.
+                list of supported orientations are available at :obj:`Pexels.constants.ORIENTATION`.
+            size (:obj:`str`, optional): Minimum photo size.
+                list of supported sizes are available at :obj:`Pexels.constants.SIZE`.
+            color (:obj:`str`, optional): Desired photo color.
+                list of supported colors are available at :obj:`Pexels.constants.COLOR`.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+                list of supported locales are available at :obj:`Pexels.constants.LOCALE_SUPPORTED`.
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.PhotoResponse`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `color` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        _check_orientation(orientation)
+        _check_color(color)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
+
+        params = {
+            'query': query,
+            'orientation': orientation,
+            'size': size,
+            'color': color,
+            'locale': locale,
+            'page': page,
+            'per_page': per_page,
+            **kwargs
+        }
+
+        data, req = await self._make_request("search", search_type='photo', query=params)
+        return PhotoResponse.from_dict(data)
+
+    async def search_curated_photo(self, page: Optional[int] = 1, per_page: Optional[int] = 15) -> PhotoResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.search_curated_photo`.
+
+        Args:
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.PhotoResponse`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {'page': page, 'per_page': per_page}
+
+        data, req = await self._make_request("curated", "photo", query=params)
+        return PhotoResponse.from_dict(data)
+
+    async def get_photo(self, id: int) -> Photo:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_photo`.
+
+        Args:
+            id (:obj:`int`): The id of the photo you are requesting.
+
+        Returns:
+            :class:`Pexels.types.Photo`
+        """
+
+        data, req = await self._make_request(f"photos/{id}", "photo")
+        return Photo.from_dict(data)
+
+    async def search_videos(
+        self,
+        query: str,
+        orientation: str = "",
+        size: str = "",
+        locale: str = "",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        **kwargs
+    ) -> VideoResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.search_videos`.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired Video orientation.
+                list of supported orientations are available at :obj:`Pexels.constants.ORIENTATION`.
+            size (:obj:`str`, optional): Minimum Video size.
+                list of supported sizes are available at :obj:`Pexels.constants.SIZE`.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+                list of supported locales are available at :obj:`Pexels.constants.LOCALE_SUPPORTED`.
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.VideoResponse`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        _check_orientation(orientation)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
+
+        params = {
+            'query': query,
+            'orientation': orientation,
+            'size': size,
+            'locale': locale,
+            'page': page,
+            'per_page': per_page,
+            **kwargs
+        }
+
+        data, req = await self._make_request("search", search_type="video", query=params)
+        return VideoResponse.from_dict(data)
+
+    async def get_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 15,
+        **kwargs
+    ) -> VideoResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_popular_videos`.
+
+        Args:
+            min_width (:obj:`int`, optional): The minimum width in pixels of the returned videos.
+            min_height (:obj:`int`, optional): The maximum height in pixels of the returned videos.
+            min_duration (:obj:`int`, optional): The minimum duration in seconds of the returned videos.
+            max_duration (:obj:`int`, optional): The maximum duration in seconds of the returned videos.
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.VideoResponse`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {
+            'min_width': min_width,
+            'min_height': min_height,
+            'min_duration': min_duration,
+            'max_duration': max_duration,
+            'page': page,
+            'per_page': per_page,
+            **kwargs
+        }
+
+        data, req = await self._make_request("popular", "video", query=params)
+        return VideoResponse.from_dict(data)
+
+    async def get_video(self, id: int) -> Video:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_video`.
+
+        Args:
+            id (:obj:`int`): The id of the video you are requesting.
+
+        Returns:
+            :class:`Pexels.types.Video`
+        """
+
+        data, req = await self._make_request(f"videos/{id}", "video")
+        return Video.from_dict(data)
+
+    async def get_featured_collections(self, page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_featured_collections`.
+
+        Args:
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.CollectionResponse`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {'page': page, 'per_page': per_page}
+
+        data, req = await self._make_request("collections/featured", "photo", query=params)
+        return CollectionResponse.from_dict(data)
+
+    async def get_my_collections(self, page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_my_collections`.
+
+        Args:
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.CollectionResponse`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {'page': page, 'per_page': per_page}
+
+        data, req = await self._make_request("collections", "photo", query=params)
+        return CollectionResponse.from_dict(data)
+
+    async def get_collection_media(self, id: str, type: Optional[str] = "", page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionMediaResponse:
+        """
+        Asynchronous version of :meth:`Pexels.client.Client.get_collection_media`.
+
+        Args:
+            id (:obj:`str`): The id of the collection you are requesting.
+            type (:obj:`str`, optional): The type of media you are requesting, If not given or if given with an invalid
+                value, all media will be returned. Supported values are `photos` and `videos`
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 15 Max: 80
+
+        Returns:
+            :class:`Pexels.types.CollectionMediaResponse`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {"type": type, "page": page, "per_page": per_page}
+
+        data, req = await self._make_request(f"collections/{id}", "photo", query=params)
+        return CollectionMediaResponse.from_dict(data)
@@ -0,0 +1,403 @@
+"""Response caches for the Client"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+DEFAULT_TTLS: Dict[str, float] = {
+    'curated': 300,
+    'popular': 300,
+    'search': 3600,
+    'videos/search': 3600,
+    'photos/{id}': 86400,
+    'videos/{id}': 86400,
+    'collections/featured': 3600,
+    'collections': 60,
+    'collections/{id}': 600,
+}
+"Default time to live in seconds of the cached responses, per endpoint."
+
+
+def endpoint_name(url: str) -> str:
+    """
+    Name of the API endpoint a URL belongs to, e.g. ``search``, ``videos/search``, ``photos/{id}``.
+
+    Args:
+        url (:obj:`str`): Full URL or path of the request.
+
+    Returns:
+        :obj:`str`
+    """
+
+    segments = [segment for segment in urlsplit(url).path.split('/') if segment]
+    if not segments:
+        return ''
+
+    last = segments[-1]
+    parent = segments[-2] if len(segments) > 1 else ''
+    if last == 'search':
+        return 'videos/search' if 'videos' in segments[:-1] else 'search'
+    if last in ('curated', 'popular'):
+        return last
+    if last == 'featured' and parent == 'collections':
+        return 'collections/featured'
+    if last == 'collections':
+        return 'collections'
+    if parent in ('photos', 'videos', 'collections'):
+        return f'{parent}/{{id}}'
+    return '/'.join(segments)
+
+
+def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Normalized cache key of a request: the method, the URL without duplicated slashes and
+    the query parameters sorted, with empty values dropped.
+
+    Args:
+        method (:obj:`str`): HTTP method of the request.
+        url (:obj:`str`): Full URL of the request, may already carry query parameters.
+        params (:obj:`dict`, optional): Query parameters sent along with the URL.
+
+    Returns:
+        :obj:`str`
+    """
+
+    split = urlsplit(url)
+    path = '/' + '/'.join(segment for segment in split.path.split('/') if segment)
+    query = [(key, value) for key, value in parse_qsl(split.query) if value != '']
+    query += [(key, str(value)) for key, value in (params or {}).items() if value is not None and value != '']
+    return f"{method.upper()} {split.scheme}://{split.netloc}{path}?{urlencode(sorted(query))}"
+
+
+class ResponseCache:
+    """
+    This object represents an in-memory LRU cache of decoded API responses.
+
+    Cached entries are the decoded JSON, so every hit still builds fresh :mod:`Pexels.types` objects.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", cache=ResponseCache(max_entries=10000))
+
+    Args:
+        max_entries (:obj:`int`, optional): Maximum number of cached responses. Default: 1024
+        max_bytes (:obj:`int`, optional): Maximum total size of the cached response bodies. Default: no limit
+        ttl (:obj:`float`, optional): Time to live in seconds for endpoints missing from `ttls`. Default: 3600
+        ttls (:obj:`dict`, optional): Time to live in seconds per endpoint name,
+            merged over :obj:`DEFAULT_TTLS`. See :func:`endpoint_name`.
+    """
+
+    hits: int
+    "Number of requests answered from the cache."
+    misses: int
+    "Number of requests not found in the cache."
+    evictions: int
+    "Number of entries dropped to stay within the limits."
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: float = 3600,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached data of a key, or `None` when it is missing or expired.
+
+        Args:
+            key (:obj:`str`): Key built by :func:`make_key`.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, data: Any, size: int = 0) -> None:
+        """
+        Store the data of a key, evicting the least recently used entries when a limit is reached.
+
+        Args:
+            key (:obj:`str`): Key built by :func:`make_key`.
+            data (:obj:`Any`): The decoded response.
+            size (:obj:`int`, optional): Size of the response body in bytes.
+        """
+
+        ttl = self.ttls.get(endpoint_name(key.split(' ', 1)[-1]), self.ttl)
+        if ttl <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, data, size)
+            self.size += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """
+        Drop cached entries. Without arguments the whole cache is cleared.
+
+        Args:
+            key (:obj:`str`, optional): Drop only this key.
+            endpoint (:obj:`str`, optional): Drop every entry of this endpoint name, e.g. ``curated``.
+
+        Returns:
+            :obj:`int`: The number of entries dropped.
+        """
+
+        with self._lock:
+            if key is not None:
+                keys = [key] if key in self._entries else []
+            elif endpoint is not None:
+                keys = [k for k in self._entries if endpoint_name(k.split(' ', 1)[-1]) == endpoint]
+            else:
+                keys = list(self._entries)
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters of the cache as a dict."""
+
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.size,
+            }
+
+    def _remove(self, key: str) -> None:
+        expires, data, size = self._entries.pop(key)
+        self.size -= size
+
+
+class DiskEntry(NamedTuple):
+    """A response stored by :class:`DiskCache`."""
+
+    body: bytes
+    "The raw response body."
+    etag: Optional[str]
+    "The `ETag` header of the response."
+    last_modified: Optional[str]
+    "The `Last-Modified` header of the response."
+    date: Optional[str]
+    "The `Date` header of the response."
+    expires: float
+    "UNIX timestamp after which the entry must be revalidated."
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be used without asking the API."""
+        return self.expires > time.time()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the API to answer `304 Not Modified` when this entry is still valid."""
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    This object represents a persistent response cache stored in a SQLite database.
+
+    Raw response bodies are kept with their `ETag`, `Last-Modified` and `Date` headers.
+    Once an entry is stale the client revalidates it with `If-None-Match`/`If-Modified-Since`,
+    and a `304 Not Modified` answer is served from disk.
+    Several processes on the same host can share one database file.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", disk_cache=DiskCache("~/.cache/pexels.sqlite"))
+
+    Args:
+        path (:obj:`str`): Path of the SQLite database, created when missing.
+        ttl (:obj:`float`, optional): Time to live in seconds for endpoints missing from `ttls`. Default: 3600
+        ttls (:obj:`dict`, optional): Time to live in seconds per endpoint name,
+            merged over :obj:`DEFAULT_TTLS`. See :func:`endpoint_name`.
+        timeout (:obj:`float`, optional): Seconds to wait for a lock held by another process. Default: 30
+    """
+
+    hits: int
+    "Number of requests answered from disk without asking the API."
+    revalidated: int
+    "Number of stale entries the API confirmed with `304 Not Modified`."
+    misses: int
+    "Number of requests not found on disk, or found stale."
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 3600,
+        ttls: Optional[Dict[str, float]] = None,
+        timeout: float = 30
+    ):
+
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.timeout = timeout
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+                "date TEXT, stored REAL NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads, keep one per thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[DiskEntry]:
+        """
+        Return the stored entry of a key, fresh or stale, or `None` when it is missing.
+
+        Args:
+            key (:obj:`str`): Key built by :func:`make_key`.
+        """
+
+        row = self._connect().execute(
+            "SELECT body, etag, last_modified, date, expires FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        entry = DiskEntry(*row) if row is not None else None
+        with self._lock:
+            if entry is not None and entry.fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry
+
+    def set(self, key: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Store a response body with its validators.
+
+        Args:
+            key (:obj:`str`): Key built by :func:`make_key`.
+            body (:obj:`bytes`): The raw response body.
+            headers (:obj:`Mapping`): The response headers.
+        """
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, headers.get('ETag'), headers.get('Last-Modified'), headers.get('Date'),
+                 now, now + self._ttl(key))
+            )
+
+    def touch(self, key: str, headers: Mapping[str, str]) -> None:
+        """
+        Mark a stale entry as fresh again after a `304 Not Modified` answer.
+
+        Args:
+            key (:obj:`str`): Key built by :func:`make_key`.
+            headers (:obj:`Mapping`): The headers of the `304` response.
+        """
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE responses SET etag = COALESCE(?, etag), date = COALESCE(?, date), stored = ?, expires = ? "
+                "WHERE key = ?",
+                (headers.get('ETag'), headers.get('Date'), now, now + self._ttl(key), key)
+            )
+        with self._lock:
+            self.revalidated += 1
+
+    def invalidate(self, key: Optional[str] = None, endpoint: Optional[str] = None) -> int:
+        """
+        Drop stored entries. Without arguments the whole cache is cleared.
+
+        Args:
+            key (:obj:`str`, optional): Drop only this key.
+            endpoint (:obj:`str`, optional): Drop every entry of this endpoint name, e.g. ``curated``.
+
+        Returns:
+            :obj:`int`: The number of entries dropped.
+        """
+
+        with self._connect() as conn:
+            if key is not None:
+                return conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+            if endpoint is None:
+                return conn.execute("DELETE FROM responses").rowcount
+            keys = [
+                (k,) for (k,) in conn.execute("SELECT key FROM responses")
+                if endpoint_name(k.split(' ', 1)[-1]) == endpoint
+            ]
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+            return len(keys)
+
+    def purge(self, max_age: float) -> int:
+        """
+        Drop the entries stored or revalidated more than `max_age` seconds ago.
+
+        Args:
+            max_age (:obj:`float`): Age in seconds.
+
+        Returns:
+            :obj:`int`: The number of entries dropped.
+        """
+
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM responses WHERE stored < ?", (time.time() - max_age,)).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters of this process as a dict."""
+
+        with self._lock:
+            return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses}
+
+    def _ttl(self, key: str) -> float:
+        return self.ttls.get(endpoint_name(key.split(' ', 1)[-1]), self.ttl)
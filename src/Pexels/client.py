@@ -3,13 +3,69 @@ Client class for the Pexels Unofficial API Wrapper
 Author: Joker Hacker
 """
 
-from json import JSONDecodeError
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import itertools
+import math
 import re
-from typing import Any, Dict, Tuple, Optional, Union
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Union
+from urllib.parse import parse_qs, urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from Pexels.cache import DiskCache, DiskEntry, ResponseCache, endpoint_name, make_key
+from Pexels.coalesce import SingleFlight
+from Pexels.decoders import get_decoder
 from Pexels.constants import COLOR, LOCALE_SUPPORTED, ORIENTATION, SIZE
+from Pexels.download import CHUNK_SIZE, Media, download, media_url
 from Pexels.errors import PexelsError, QuotaExceedError
-from Pexels.types import CollectionMediaResponse, CollectionResponse, Photo, PhotoResponse, Video, VideoResponse
+from Pexels.hedge import HedgePolicy
+from Pexels.index import LocalIndex
+from Pexels.metrics import Metrics
+from Pexels.ratelimit import RateLimiter
+from Pexels.retry import RetryPolicy, parse_retry_after
+from Pexels.streaming import STREAM_CHUNK_SIZE, PageStream
+from Pexels.types import _MEDIA_TYPES, Collection, CollectionMediaResponse, CollectionResponse, Photo, PhotoResponse, Video, VideoResponse
+
+# the endpoints returning photos and videos, stored by the local index
+_INDEXED_ENDPOINTS = frozenset(('search', 'curated', 'videos/search', 'popular', 'photos/{id}', 'videos/{id}', 'collections/{id}'))
+
+
+def _check_orientation(orientation: str) -> None:
+    if orientation not in ORIENTATION and orientation != "":
+        raise PexelsError("Invalid value given for orientation, supported ones are landscape, portrait and square.")
+
+
+def _check_color(color: str) -> None:
+    if color in COLOR or color == "":
+        return
+    if not re.search(r'^#(?:[0-9a-fA-F]{3}){1,2}$', color):
+        raise PexelsError("Invalid color name or hexadecimal code given.")
+
+
+def _check_size(size: str) -> None:
+    if size not in SIZE and size != "":
+        raise PexelsError("Invalid photo size given, the supported ones are large, medium and small.")
+
+
+def _check_locale(locale: str) -> None:
+    if locale != "" and locale not in LOCALE_SUPPORTED:
+        raise PexelsError("Invalid locale given.")
+
+
+def _check_per_page(per_page: int) -> None:
+    if per_page > 80:
+        raise PexelsError("per_page can not be more than 80")
+
+
+def _raise_for_status(req: requests.Response) -> None:
+    if req.status_code == 400:
+        raise PexelsError("Bad Request Caught")
+    elif req.status_code == 429:
+        raise QuotaExceedError("You have exceeded your rate limit.")
+    else:
+        raise PexelsError(f"{req.status_code} : {req.reason}")
+
 
 class Client:
     """
@@ -29,6 +85,10 @@ class Client:
 
         * The `prev_page` and `next_page` response attributes will only be returned if there is a corresponding page. 
 
+        * A client can be shared by any number of threads, e.g. the workers of a :class:`concurrent.futures.ThreadPoolExecutor`.
+        Requests never modify shared state without a lock, and `pool_size` should match the number of threads
+        so every one of them reuses a kept-alive connection.
+
     Warning:
         * You may not copy or replicate core functionality of Pexels (including making Pexels content available as a wallpaper app).
 
@@ -40,13 +100,52 @@ class Client:
             defaults to https://api.pexels.com/v1/
         video_endpoint (:obj:`str`, optional): Video endpoint of the API,
             defaults to https://api.pexels.com/videos
+        rate_limiter (:class:`Pexels.ratelimit.RateLimiter`, optional): Scheduler pacing the requests
+            from the rate limit headers. By default the headers are only recorded.
+        max_workers (:obj:`int`, optional): The number of threads used by :meth:`submit`. Default: 4
+        cache (:class:`Pexels.cache.ResponseCache`, optional): In-memory cache of the decoded responses.
+            Default: no cache
+        disk_cache (:class:`Pexels.cache.DiskCache`, optional): Persistent cache revalidated with
+            `ETag`/`Last-Modified`, consulted after `cache`. Default: no cache
+        lazy (:obj:`bool`, optional): Keep the decoded JSON in the responses and only build
+            :mod:`Pexels.types` objects when they are first accessed. Default: False
+        coalesce (:obj:`bool`, optional): Let identical GET requests made at the same time from several threads
+            share one upstream call. Default: False
+        pool_size (:obj:`int`, optional): The number of connections kept open to the API,
+            set it to the number of threads sharing this client. Default: 10
+        retry (:class:`Pexels.retry.RetryPolicy`, optional): When and how failed requests are retried.
+            Default: no retry
+        timeout (:obj:`float`, optional): Seconds to wait for the API to connect and answer. Default: no timeout
+        hedge (:class:`Pexels.hedge.HedgePolicy`, optional): Send a duplicate of slow `get_photo`/`get_video`
+            requests and use the first answer. Default: no hedging
+        metrics (:class:`Pexels.metrics.Metrics`, optional): Records latency, status codes, sizes and decode time
+            of every request, and runs its hooks. Default: no instrumentation
+        json_decoder (:obj:`str` or :obj:`Callable`, optional): The name of a decoder from
+            :obj:`Pexels.decoders.DECODERS` or a function decoding :obj:`bytes`.
+            Default: the fastest installed one, see :func:`Pexels.decoders.get_decoder`
+        index (:class:`Pexels.index.LocalIndex`, optional): Stores every photo and video received from the API,
+            streamed pages included, for :meth:`Pexels.index.LocalIndex.search_local`. Responses served by the
+            caches are not stored again. Default: no index
     """
 
     def __init__(
         self,
         token: str,
         base_endpoint: str = "https://api.pexels.com/v1/",
-        video_endpoint: str = "https://api.pexels.com/videos"
+        video_endpoint: str = "https://api.pexels.com/videos",
+        rate_limiter: Optional[RateLimiter] = None,
+        max_workers: int = 4,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        lazy: bool = False,
+        coalesce: bool = False,
+        pool_size: int = 10,
+        retry: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
+        json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None,
+        index: Optional[LocalIndex] = None
     ):
 
         self._base_endpoint = base_endpoint
@@ -54,6 +153,127 @@ class Client:
         self._token = token
         self._header = {'Authorization': self._token}
         self.session = requests.Session()
+        # one pool per host: the API, images.pexels.com and the video hosts used by download()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(pace=False)
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.lazy = lazy
+        self.single_flight = SingleFlight() if coalesce else None
+        self.retry = retry
+        self.timeout = timeout
+        self.hedge = hedge
+        self._pool_size = pool_size
+        self._hedge_executor = None
+        self.metrics = metrics
+        self._decode = json_decoder if callable(json_decoder) else get_decoder(json_decoder)
+        self.index = index
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls which waited for an identical request in flight instead of sending their own."""
+        return self.single_flight.coalesced if self.single_flight is not None else 0
+
+    @property
+    def rate_limit(self) -> Optional[int]:
+        """The total number of requests allowed in the current period, as last reported by the API."""
+        return self.rate_limiter.limit
+
+    @property
+    def rate_limit_remaining(self) -> Optional[int]:
+        """The number of requests left in the current period, as last reported by the API."""
+        return self.rate_limiter.remaining
+
+    @property
+    def rate_limit_reset(self) -> Optional[float]:
+        """UNIX timestamp at which the current rate limit period ends."""
+        return self.rate_limiter.reset
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Run a client method on a background thread instead of blocking the caller,
+        for example while the :class:`Pexels.ratelimit.RateLimiter` is waiting for budget.
+
+        .. code:: python
+
+            future = client.submit(client.search_photos, "Nature")
+            photos = future.result()
+
+        Args:
+            func (:obj:`Callable`): The method to call, usually a bound method of this client.
+            *args: Positional arguments given to `func`.
+            **kwargs: Keyword arguments given to `func`.
+
+        Returns:
+            :class:`concurrent.futures.Future` resolving to the return value of `func`.
+        """
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor.submit(func, *args, **kwargs)
+
+    def close(self) -> None:
+        """Close the connections of this client and wait for the calls given to :meth:`submit`."""
+
+        with self._lock:
+            executors = [self._executor, self._hedge_executor]
+            self._executor = self._hedge_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def download(
+        self,
+        media: Media,
+        dest: str,
+        variant: str = "original",
+        chunk_size: int = CHUNK_SIZE,
+        expected_size: Optional[int] = None,
+        resume: bool = True,
+        **kwargs
+    ) -> str:
+        """
+        Download a photo or video file to disk, streaming it over the pooled session of this client.
+        Partial files are resumed and the file only appears at `dest` once complete.
+
+        .. code:: python
+
+            photo = client.get_photo(2014422)
+            client.download(photo, "downloads/", variant="large2x")
+
+        Args:
+            media: A :class:`Pexels.types.Photo`, :class:`Pexels.types.Src`, :class:`Pexels.types.Video`,
+                :class:`Pexels.types.VideoFiles` or a URL.
+            dest (:obj:`str`): The destination file, or a directory to keep the name from the URL and variant.
+            variant (:obj:`str`, optional): For photos, the :class:`Pexels.types.Src` attribute to download.
+                For videos, the quality of the rendition, the largest one is picked. Default: original
+            chunk_size (:obj:`int`, optional): Number of bytes read and written at once. Default: 1 MiB
+            expected_size (:obj:`int`, optional): Size the file must have. Default: the size announced by the server
+            resume (:obj:`bool`, optional): Whether to continue a partial file. Default: True
+            **kwargs: Passed to :func:`Pexels.download.download`.
+
+        Returns:
+            :obj:`str`: The path of the downloaded file.
+
+        Raises:
+            PexelsError: When the variant does not exist, the server answers with an error or the size is wrong.
+        """
+
+        url = media_url(media, variant)
+        return download(self.session, url, dest, chunk_size, expected_size, resume, variant=variant, **kwargs)
 
     def _make_request(
         self,
@@ -62,40 +282,345 @@ class Client:
         method: str = "get",
         query: Dict = {},
         **kwargs: Dict[Any, Any]
-    ) -> Tuple[Union[Dict, str], requests.Response]:
+    ) -> Tuple[Union[Dict, str], Optional[requests.Response]]:
 
-        if search_type == 'photo':
-            endpoint = self._base_endpoint
-            req = self.session.request(
-                    method, 
-                    f'{endpoint}/{path}', 
-                    headers=self._header, 
-                    params=query,
-                    **kwargs
-                )
+        url = self._url(path, search_type)
+        key = None
+        entry = None
+        headers = self._header
+        if method.lower() == "get" and (
+            self.cache is not None or self.disk_cache is not None or self.single_flight is not None
+        ):
+            key = make_key(method, url, query)
+            if self.cache is not None:
+                data = self.cache.get(key)
+                if data is not None:
+                    if self.metrics is not None:
+                        self.metrics.cache_hit(url)
+                    return data, None
+            if self.disk_cache is not None:
+                entry = self.disk_cache.get(key)
+                if entry is not None and entry.fresh:
+                    if self.metrics is not None:
+                        self.metrics.cache_hit(url)
+                    return self._remember(key, self._decode(entry.body), len(entry.body)), None
+                if entry is not None:
+                    headers = {**self._header, **entry.conditional_headers()}
+
+        def send():
+            return self._send(method, url, headers, query, key, entry, **kwargs)
+
+        fetch = send
+        if self.hedge is not None and method.lower() == "get" and self.hedge.applies(endpoint_name(url)):
+            fetch = lambda: self._hedged(send, endpoint_name(url))
+        if self.single_flight is not None and key is not None:
+            return self.single_flight.do(key, fetch)
+        return fetch()
+
+    def _url(self, path: str, search_type: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        elif search_type == 'photo':
+            return f'{self._base_endpoint}/{path}'
         elif search_type == 'video':
-            endpoint = self._video_endpoint
-            req = self.session.request(
-                    method, 
-                    f'{endpoint}/{path}', 
-                    headers=self._header, 
-                    params=query,
-                    **kwargs,
-                )
+            return f'{self._video_endpoint}/{path}'
         else:
             raise PexelsError("Invalid parameter search_type given")
 
-        if req.status_code in [200, 201]:
+    def _stream(
+        self,
+        path: str,
+        search_type: str,
+        query: Dict,
+        items: str,
+        factory: Callable[[Dict], Any],
+        chunk_size: int
+    ) -> PageStream:
+        # caches, coalescing and hedging work on whole bodies, streamed requests go straight to the network
+        req = self._request("get", self._url(path, search_type), self._header, query, stream=True)
+        if req.status_code not in [200, 201]:
+            req.close()
+            _raise_for_status(req)
+        if self.index is not None:
+            build = factory
+
+            def factory(data: Dict) -> Any:
+                self.index.add(data)
+                return build(data)
+        return PageStream(req.iter_content(chunk_size), items, factory, self._decode, req.close)
+
+    def _hedged(self, send: Callable[[], Any], endpoint: str) -> Any:
+        with self._lock:
+            if self._hedge_executor is None:
+                # a request and its hedge for every thread sharing the client and every worker of submit(),
+                # threads are only started when needed
+                self._hedge_executor = ThreadPoolExecutor(max_workers=(self._pool_size + self._max_workers) * 2)
+        executor = self._hedge_executor
+
+        def timed(sent: threading.Event):
+            # timed from the moment a worker sends it, the time queued in the executor is not latency
+            started = time.monotonic()
+            sent.set()
+            result = send()
+            self.hedge.record(endpoint, time.monotonic() - started)
+            return result
+
+        primary_sent = threading.Event()
+        primary = executor.submit(timed, primary_sent)
+        delay = self.hedge.begin(endpoint)
+        primary_sent.wait()
+        done, pending = wait([primary], timeout=delay)
+        if done or not self.hedge.allow():
+            return primary.result()
+
+        # the loser can not be interrupted, it completes in the background and is ignored
+        backup = executor.submit(timed, threading.Event())
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        self.hedge.won()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        query: Dict,
+        key: Optional[str],
+        entry: Optional[DiskEntry],
+        **kwargs: Dict[Any, Any]
+    ) -> Tuple[Union[Dict, str], requests.Response]:
+
+        req = self._request(method, url, headers, query, **kwargs)
+        if req.status_code == 304 and entry is not None:
+            self.disk_cache.touch(key, req.headers)
+            return self._remember(key, self._decode(entry.body), len(entry.body)), req
+        elif req.status_code in [200, 201]:
+            decoding = time.perf_counter()
             try:
-                return req.json(), req
-            except JSONDecodeError:
+                data = self._decode(req.content)
+            except ValueError:
                 return req.text, req
-        elif req.status_code == 400:
-            raise PexelsError("Bad Request Caught")
-        elif req.status_code == 429:
-            raise QuotaExceedError("You have exceeded your rate limit.")
+            if self.metrics is not None:
+                self.metrics.observe_decode(url, time.perf_counter() - decoding)
+            if self.index is not None and endpoint_name(url) in _INDEXED_ENDPOINTS:
+                # only bodies received from the API, cache hits and 304 replays were indexed when first received
+                self.index.add(data)
+            if key is not None:
+                self._remember(key, data, len(req.content))
+                if self.disk_cache is not None:
+                    self.disk_cache.set(key, req.content, req.headers)
+            return data, req
+        _raise_for_status(req)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        query: Dict,
+        **kwargs: Dict[Any, Any]
+    ) -> requests.Response:
+
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+
+        started = time.monotonic()
+        attempt = 0
+        waited_reset = False
+        while True:
+            self.rate_limiter.acquire()
+            if self.metrics is not None:
+                self.metrics.request_started(method, url)
+            sent = time.perf_counter()
+            try:
+                req = self.session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=query,
+                        **kwargs
+                    )
+            except requests.RequestException as exc:
+                if self.metrics is not None:
+                    self.metrics.request_finished(method, url, time.perf_counter() - sent, error=exc)
+                delay = self._retry_delay(method, url, attempt, started, error=exc)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+                continue
+
+            self.rate_limiter.update(req.headers)
+            if self.metrics is not None:
+                # a streamed body is not read yet, its announced size is recorded instead
+                size = int(req.headers.get("Content-Length") or 0) if kwargs.get("stream") else None
+                self.metrics.request_finished(method, url, time.perf_counter() - sent, req, size=size)
+                self.metrics.update_rate_limit(
+                    self.rate_limiter.limit, self.rate_limiter.remaining, self.rate_limiter.reset
+                )
+            retry_after = parse_retry_after(req.headers)
+            # wait for the reset instead of failing, when the API tells us when that is
+            if req.status_code == 429 and self.rate_limiter.pace and not waited_reset:
+                if self.rate_limiter.exhausted(retry_after):
+                    waited_reset = True
+                    req.close()
+                    continue
+
+            delay = self._retry_delay(method, url, attempt, started, req.status_code, retry_after=retry_after)
+            if delay is None:
+                return req
+            req.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def _retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        started: float,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        if self.retry is None:
+            return None
+        elapsed = time.monotonic() - started
+        return self.retry.next_delay(method, url, attempt, elapsed, status, error, retry_after)
+
+    def _build(self, model: type, data: Dict) -> Any:
+        if self.metrics is None:
+            result = model.from_dict(data, lazy=self.lazy)
         else:
-            raise PexelsError(f"{req.status_code} : {req.reason}")
+            started = time.perf_counter()
+            result = model.from_dict(data, lazy=self.lazy)
+            self.metrics.observe_build(model.__name__, time.perf_counter() - started)
+        return result
+
+    def _remember(self, key: str, data: Any, size: int) -> Any:
+        if self.cache is not None:
+            self.cache.set(key, data, size)
+        return data
+
+    def _paginate(
+        self,
+        first: Callable[[], Any],
+        search_type: str,
+        items: str,
+        params: Dict = {}
+    ) -> Iterator[Any]:
+        """
+        Yield every object of the ``items`` attribute across all pages, starting with ``first()``.
+
+        The page behind ``next_page`` is requested on a background thread while the caller consumes
+        the current one, so at most two pages are held in memory at any time.
+        """
+
+        response = first()
+        response_type = type(response)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                future = None
+                if response.next_page:
+                    future = executor.submit(self._next_page, response.next_page, search_type, response_type, params)
+                yield from getattr(response, items)
+                if future is None:
+                    return
+                response = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_page(self, url: str, search_type: str, response_type: type, params: Dict) -> Any:
+        # next_page does not always carry the filters of the first request, re-apply the missing ones.
+        present = parse_qs(urlsplit(url).query)
+        missing = {key: value for key, value in params.items() if key not in present}
+        data, req = self._make_request(url, search_type, query=missing)
+        return self._build(response_type, data)
+
+    def _fan_out(
+        self,
+        fetch: Callable[[int], Any],
+        items: str,
+        max_results: Optional[int],
+        concurrency: int,
+        key: Callable[[Any], Any] = lambda obj: obj.id
+    ) -> List[Any]:
+        """
+        Request the first page, derive the page count from its ``total_results`` and ``per_page``,
+        then request the remaining pages on a pool of ``concurrency`` workers.
+        Objects are returned in page order, without duplicates. When pages overlap, more pages are
+        requested until ``max_results`` distinct objects are collected or the results run out.
+        """
+
+        first = fetch(1)
+        per_page = first.per_page
+        available = max(1, math.ceil(first.total_results / per_page)) if per_page else 1
+        total = first.total_results if max_results is None else min(first.total_results, max_results)
+        last_page = min(available, max(1, math.ceil(total / per_page))) if per_page else 1
+
+        seen = set()
+        results = []
+
+        def collect(page: Any) -> bool:
+            # returns True once max_results objects are collected
+            for obj in getattr(page, items):
+                if key(obj) in seen:
+                    continue
+                seen.add(key(obj))
+                results.append(obj)
+                if max_results is not None and len(results) >= max_results:
+                    return True
+            return False
+
+        if collect(first):
+            return results
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while next_page <= last_page:
+                for page in executor.map(fetch, range(next_page, last_page + 1)):
+                    if collect(page):
+                        return results
+                next_page = last_page + 1
+                if max_results is not None:
+                    last_page = min(available, last_page + math.ceil((max_results - len(results)) / per_page))
+        return results
+
+    def _batch(
+        self,
+        fetch: Callable[[Any], Any],
+        ids: Iterable[Any],
+        concurrency: int
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Call ``fetch`` once per distinct id on a pool of ``concurrency`` workers and yield
+        ``(id, result)`` pairs in completion order, the exception raised being the result of a failed id.
+        At most twice ``concurrency`` calls are queued, so an abandoned iteration stops early.
+        """
+
+        pending_ids = iter(dict.fromkeys(ids))
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures: Dict[Future, Any] = {}
+        try:
+            for id in itertools.islice(pending_ids, concurrency * 2):
+                futures[executor.submit(fetch, id)] = id
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    id = futures.pop(future)
+                    for next_id in itertools.islice(pending_ids, 1):
+                        futures[executor.submit(fetch, next_id)] = next_id
+                    error = future.exception()
+                    yield id, (error if error is not None else future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def search_photos(
         self, 
@@ -133,37 +658,11 @@ class Client:
             PexelsError: When invalid `orientation` or `color` or `size` or `locale` given or when `per_page` is above 80.
         """
 
-        if orientation in ORIENTATION:
-            pass
-        elif orientation == "":
-            pass
-        else:
-            raise PexelsError("Invalid value given for orientation, supported ones are landscape, portrait and square.")
-        
-        color_match = re.search(r'^#(?:[0-9a-fA-F]{3}){1,2}$', color)
-        if color in COLOR:
-            pass
-        elif color_match:
-            pass
-        elif color == "":
-            pass
-        else:
-            raise PexelsError("Invalid color name or hexadecimal code given.")
-
-        if size in SIZE:
-            pass
-        elif size == "":
-            pass
-        else:
-            raise PexelsError("Invalid photo size given, the supported ones are large, medium and small.")
-
-        if locale == "":
-            pass
-        elif locale not in LOCALE_SUPPORTED:
-            raise PexelsError("Invalid locale given.")
-
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80")
+        _check_orientation(orientation)
+        _check_color(color)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
 
         params = {
             'orientation': orientation, 
@@ -176,7 +675,7 @@ class Client:
         }
 
         data, req = self._make_request(f"search?query={query}", search_type='photo', query=params)
-        return PhotoResponse(**data)
+        return self._build(PhotoResponse, data)
 
     def search_curated_photo(self, page: Optional[int] =1, per_page: Optional[int] = 15) -> PhotoResponse:
         """
@@ -193,13 +692,12 @@ class Client:
         Raises:
             PexelsError: When `per_page` is above 80.
         """
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80")
+        _check_per_page(per_page)
 
         params = {'page': page, 'per_page': per_page}
 
         data, req = self._make_request("curated", "photo", query=params)
-        return PhotoResponse(**data)
+        return self._build(PhotoResponse, data)
 
     def get_photo(self, id: int) -> Photo:
         """
@@ -213,7 +711,7 @@ class Client:
         """
 
         data, req = self._make_request(f"photos/{id}", "photo")
-        return Photo(**data)
+        return self._build(Photo, data)
 
     def search_videos(
         self,
@@ -247,27 +745,10 @@ class Client:
             PexelsError: When invalid `orientation` or `size` or `locale` given or when `per_page` is above 80.
         """
 
-        if orientation in ORIENTATION:
-            pass
-        elif orientation == "":
-            pass
-        else:
-            raise PexelsError("Invalid value given for orientation, supported ones are landscape, portrait and square.")
-        
-        if size in SIZE:
-            pass
-        elif size == "":
-            pass
-        else:
-            raise PexelsError("Invalid photo size given, the supported ones are large, medium and small.")
-
-        if locale == "":
-            pass
-        elif locale not in LOCALE_SUPPORTED:
-            raise PexelsError("Invalid locale given.")
-
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80")
+        _check_orientation(orientation)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
 
         params = {
             'orientation': orientation, 
@@ -279,7 +760,7 @@ class Client:
         }
 
         data, req = self._make_request(f"search?query={query}", search_type="video", query=params)
-        return VideoResponse(**data)
+        return self._build(VideoResponse, data)
 
     def get_popular_videos(
         self,
@@ -309,8 +790,7 @@ class Client:
             PexelsError: When `per_page` is above 80.
         """
 
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80")
+        _check_per_page(per_page)
 
         params = {
             'min_width': min_width,
@@ -318,11 +798,12 @@ class Client:
             'min_duration': min_duration,
             'max_duration': max_duration,
             'page': page,
+            'per_page': per_page,
             **kwargs
         }
 
         data, req = self._make_request("popular", "video", query=params)
-        return VideoResponse(**data)
+        return self._build(VideoResponse, data)
 
     def get_video(self, id: int) -> Video:
         """
@@ -336,7 +817,7 @@ class Client:
         """
         
         data, req = self._make_request(f"videos/{id}", "video")
-        return Video(**data)
+        return self._build(Video, data)
     
     def get_featured_collections(self, page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionResponse:
         """
@@ -352,13 +833,12 @@ class Client:
         Raises:
             PexelsError: When `per_page` is above 80.
         """
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80.")
+        _check_per_page(per_page)
 
         params = {'page': page, 'per_page': per_page}
 
         data, req = self._make_request("collections/featured", "photo", query=params)
-        return CollectionResponse(**data)
+        return self._build(CollectionResponse, data)
 
     def get_my_collections(self, page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionResponse:
         """
@@ -374,13 +854,12 @@ class Client:
         Raises:
             PexelsError: When `per_page` is above 80."""
 
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80.")
+        _check_per_page(per_page)
 
         params = {'page': page, 'per_page': per_page}
 
         data, req = self._make_request("collections", "photo", query=params)
-        return CollectionResponse(**data)
+        return self._build(CollectionResponse, data)
     
     def get_collection_media(self,id: str, type: Optional[str] = "", page: Optional[int] = 1, per_page: Optional[int] = 15, **kwargs) -> CollectionMediaResponse:
         """
@@ -399,10 +878,475 @@ class Client:
             PexelsError: When `per_page` is above 80.
         """
 
-        if per_page > 80:
-            raise PexelsError("per_page can not be more than 80.")
+        _check_per_page(per_page)
 
         params = {"type": type, "page": page, "per_page": per_page}
 
         data , req = self._make_request(f"collections/{id}", "photo", query=params)
-        return CollectionMediaResponse(**data)
+        return self._build(CollectionMediaResponse, data)
+
+    def iter_search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = "",
+        size: Optional[str] = "",
+        color: Optional[str] = "",
+        locale: Optional[str] = "",
+        per_page: Optional[int] = 80,
+        **kwargs
+    ) -> Iterator[Photo]:
+        """
+        Iterate over every photo matching a search, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        .. code:: python
+
+            for photo in client.iter_search_photos("Nature"):
+                print(photo.id)
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired photo orientation.
+            size (:obj:`str`, optional): Minimum photo size.
+            color (:obj:`str`, optional): Desired photo color.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Photo`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `color` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        params = {'orientation': orientation, 'size': size, 'color': color, 'locale': locale, 'per_page': per_page, **kwargs}
+        return self._paginate(lambda: self.search_photos(query, page=1, **params), "photo", "photos", params)
+
+    def iter_curated_photos(self, per_page: Optional[int] = 80) -> Iterator[Photo]:
+        """
+        Iterate over every curated photo, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        Args:
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Photo`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        params = {'per_page': per_page}
+        return self._paginate(lambda: self.search_curated_photo(page=1, **params), "photo", "photos", params)
+
+    def iter_search_videos(
+        self,
+        query: str,
+        orientation: str = "",
+        size: str = "",
+        locale: str = "",
+        per_page: Optional[int] = 80,
+        **kwargs
+    ) -> Iterator[Video]:
+        """
+        Iterate over every video matching a search, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired Video orientation.
+            size (:obj:`str`, optional): Minimum Video size.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        params = {'orientation': orientation, 'size': size, 'locale': locale, 'per_page': per_page, **kwargs}
+        return self._paginate(lambda: self.search_videos(query, page=1, **params), "video", "videos", params)
+
+    def iter_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        per_page: Optional[int] = 80,
+        **kwargs
+    ) -> Iterator[Video]:
+        """
+        Iterate over every popular video, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        Args:
+            min_width (:obj:`int`, optional): The minimum width in pixels of the returned videos.
+            min_height (:obj:`int`, optional): The minimum height in pixels of the returned videos.
+            min_duration (:obj:`int`, optional): The minimum duration in seconds of the returned videos.
+            max_duration (:obj:`int`, optional): The maximum duration in seconds of the returned videos.
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        params = {
+            'min_width': min_width,
+            'min_height': min_height,
+            'min_duration': min_duration,
+            'max_duration': max_duration,
+            'per_page': per_page,
+            **kwargs
+        }
+        return self._paginate(lambda: self.get_popular_videos(page=1, **params), "video", "videos", params)
+
+    def iter_featured_collections(self, per_page: Optional[int] = 80) -> Iterator[Collection]:
+        """
+        Iterate over every featured collection, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        Args:
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Collection`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        params = {'per_page': per_page}
+        return self._paginate(lambda: self.get_featured_collections(page=1, **params), "photo", "collections", params)
+
+    def iter_collection_media(self, id: str, type: Optional[str] = "", per_page: Optional[int] = 80) -> Iterator[Union[Photo, Video]]:
+        """
+        Iterate over every media of a collection, across all pages.
+        The next page is fetched in the background while the current one is consumed.
+
+        Args:
+            id (:obj:`str`): The id of the collection you are requesting.
+            type (:obj:`str`, optional): The type of media you are requesting. Supported values are `photos` and `videos`
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Yields:
+            :class:`Pexels.types.Photo` or :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        params = {'type': type, 'per_page': per_page}
+        return self._paginate(lambda: self.get_collection_media(id, page=1, **params), "photo", "media", params)
+
+    def fetch_pages(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        concurrency: Optional[int] = 4,
+        per_page: Optional[int] = 80,
+        **kwargs
+    ) -> List[Photo]:
+        """
+        Fetch many pages of a photo search at once.
+        The first page tells how many pages exist, the remaining ones are requested in parallel.
+
+        .. code:: python
+
+            photos = client.fetch_pages("Nature", max_results=4000, concurrency=8)
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            max_results (:obj:`int`, optional): Stop after this many photos. Default: all results
+            concurrency (:obj:`int`, optional): The number of pages requested at the same time. Default: 4
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+            **kwargs: Any other parameter accepted by :meth:`search_photos`.
+
+        Returns:
+            List of :class:`Pexels.types.Photo` in page order, without duplicate ids.
+
+        Raises:
+            PexelsError: When invalid `orientation` or `color` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        fetch = lambda page: self.search_photos(query, page=page, per_page=per_page, **kwargs)
+        return self._fan_out(fetch, "photos", max_results, concurrency)
+
+    def fetch_video_pages(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        concurrency: Optional[int] = 4,
+        per_page: Optional[int] = 80,
+        **kwargs
+    ) -> List[Video]:
+        """
+        Fetch many pages of a video search at once, see :meth:`fetch_pages`.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            max_results (:obj:`int`, optional): Stop after this many videos. Default: all results
+            concurrency (:obj:`int`, optional): The number of pages requested at the same time. Default: 4
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+            **kwargs: Any other parameter accepted by :meth:`search_videos`.
+
+        Returns:
+            List of :class:`Pexels.types.Video` in page order, without duplicate ids.
+
+        Raises:
+            PexelsError: When invalid `orientation` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        fetch = lambda page: self.search_videos(query, page=page, per_page=per_page, **kwargs)
+        return self._fan_out(fetch, "videos", max_results, concurrency)
+
+    def fetch_collection_media_pages(
+        self,
+        id: str,
+        type: Optional[str] = "",
+        max_results: Optional[int] = None,
+        concurrency: Optional[int] = 4,
+        per_page: Optional[int] = 80
+    ) -> List[Union[Photo, Video]]:
+        """
+        Fetch many pages of a collection at once, see :meth:`fetch_pages`.
+
+        Args:
+            id (:obj:`str`): The id of the collection you are requesting.
+            type (:obj:`str`, optional): The type of media you are requesting. Supported values are `photos` and `videos`
+            max_results (:obj:`int`, optional): Stop after this many media. Default: all results
+            concurrency (:obj:`int`, optional): The number of pages requested at the same time. Default: 4
+            per_page (:obj:`int`, optional): The number of results requested per page. Default: 80 Max: 80
+
+        Returns:
+            List of :class:`Pexels.types.Photo` and :class:`Pexels.types.Video` in page order, without duplicates.
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        fetch = lambda page: self.get_collection_media(id, type=type, page=page, per_page=per_page)
+        return self._fan_out(fetch, "media", max_results, concurrency, key=lambda obj: (obj.__class__.__name__, obj.id))
+
+    def get_photos(self, ids: Iterable[int], concurrency: int = 8) -> List[Union[Photo, Exception]]:
+        """
+        Retrieve many photos from their ids, concurrently.
+
+        Duplicate ids are requested once, cached ids are served by the configured caches,
+        and every request waits for the :class:`Pexels.ratelimit.RateLimiter`.
+        A failed id does not stop the others, its exception takes the place of its photo.
+
+        .. code:: python
+
+            for id, photo in zip(ids, client.get_photos(ids)):
+                if isinstance(photo, Exception):
+                    print(id, "failed:", photo)
+
+        Args:
+            ids (:obj:`Iterable`): The ids of the photos you are requesting.
+            concurrency (:obj:`int`, optional): The number of requests in flight. Default: 8
+
+        Returns:
+            :obj:`list` of :class:`Pexels.types.Photo` or :obj:`Exception`, in the order of `ids`.
+        """
+
+        ids = list(ids)
+        results = dict(self.iter_photos(ids, concurrency))
+        return [results[id] for id in ids]
+
+    def iter_photos(self, ids: Iterable[int], concurrency: int = 8) -> Iterator[Tuple[int, Union[Photo, Exception]]]:
+        """
+        Same as :meth:`get_photos`, but yield every photo as soon as it is received.
+
+        Args:
+            ids (:obj:`Iterable`): The ids of the photos you are requesting.
+            concurrency (:obj:`int`, optional): The number of requests in flight. Default: 8
+
+        Yields:
+            :obj:`tuple` of the id and its :class:`Pexels.types.Photo` or :obj:`Exception`,
+            in completion order, once per distinct id.
+        """
+
+        return self._batch(self.get_photo, ids, concurrency)
+
+    def get_videos(self, ids: Iterable[int], concurrency: int = 8) -> List[Union[Video, Exception]]:
+        """
+        Retrieve many videos from their ids, concurrently. See :meth:`get_photos`.
+
+        Args:
+            ids (:obj:`Iterable`): The ids of the videos you are requesting.
+            concurrency (:obj:`int`, optional): The number of requests in flight. Default: 8
+
+        Returns:
+            :obj:`list` of :class:`Pexels.types.Video` or :obj:`Exception`, in the order of `ids`.
+        """
+
+        ids = list(ids)
+        results = dict(self.iter_videos(ids, concurrency))
+        return [results[id] for id in ids]
+
+    def iter_videos(self, ids: Iterable[int], concurrency: int = 8) -> Iterator[Tuple[int, Union[Video, Exception]]]:
+        """
+        Same as :meth:`get_videos`, but yield every video as soon as it is received.
+
+        Args:
+            ids (:obj:`Iterable`): The ids of the videos you are requesting.
+            concurrency (:obj:`int`, optional): The number of requests in flight. Default: 8
+
+        Yields:
+            :obj:`tuple` of the id and its :class:`Pexels.types.Video` or :obj:`Exception`,
+            in completion order, once per distinct id.
+        """
+
+        return self._batch(self.get_video, ids, concurrency)
+
+    def stream_search_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = "",
+        size: Optional[str] = "",
+        color: Optional[str] = "",
+        locale: Optional[str] = "",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs
+    ) -> PageStream:
+        """
+        Same as :meth:`search_photos`, but every photo is built as soon as it is received,
+        without holding the whole page in memory.
+
+        .. code:: python
+
+            with client.stream_search_photos("Nature") as stream:
+                for photo in stream:
+                    print(photo.id)
+                print(stream.next_page)
+
+        Note:
+            * The response cache, the disk cache, coalescing and hedging do not apply to streamed pages.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired photo orientation.
+            size (:obj:`str`, optional): Minimum photo size.
+            color (:obj:`str`, optional): Desired photo color.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 80 Max: 80
+            chunk_size (:obj:`int`, optional): Bytes read from the connection at once. Default: 16 KiB
+
+        Returns:
+            :class:`Pexels.streaming.PageStream` of :class:`Pexels.types.Photo`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `color` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        _check_orientation(orientation)
+        _check_color(color)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
+
+        params = {
+            'orientation': orientation,
+            'size': size,
+            'color': color,
+            'locale': locale,
+            'page': page,
+            'per_page': per_page,
+            **kwargs
+        }
+        factory = lambda data: Photo.from_dict(data, lazy=self.lazy)
+        return self._stream(f"search?query={query}", "photo", params, "photos", factory, chunk_size)
+
+    def stream_search_videos(
+        self,
+        query: str,
+        orientation: Optional[str] = "",
+        size: Optional[str] = "",
+        locale: Optional[str] = "",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **kwargs
+    ) -> PageStream:
+        """
+        Same as :meth:`search_videos`, but every video is built as soon as it is received,
+        without holding the whole page in memory. See :meth:`stream_search_photos`.
+
+        Args:
+            query (:obj:`str`): The search query. `Ocean`, `Tigers`, `Pears`, etc.
+            orientation (:obj:`str`, optional): Desired video orientation.
+            size (:obj:`str`, optional): Minimum video size.
+            locale (:obj:`str`, optional): The locale of the search you are performing.
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 80 Max: 80
+            chunk_size (:obj:`int`, optional): Bytes read from the connection at once. Default: 16 KiB
+
+        Returns:
+            :class:`Pexels.streaming.PageStream` of :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When invalid `orientation` or `size` or `locale` given or when `per_page` is above 80.
+        """
+
+        _check_orientation(orientation)
+        _check_size(size)
+        _check_locale(locale)
+        _check_per_page(per_page)
+
+        params = {
+            'orientation': orientation,
+            'size': size,
+            'locale': locale,
+            'page': page,
+            'per_page': per_page,
+            **kwargs
+        }
+        factory = lambda data: Video.from_dict(data, lazy=self.lazy)
+        return self._stream(f"search?query={query}", "video", params, "videos", factory, chunk_size)
+
+    def stream_collection_media(
+        self,
+        id: str,
+        type: Optional[str] = "",
+        page: Optional[int] = 1,
+        per_page: Optional[int] = 80,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> PageStream:
+        """
+        Same as :meth:`get_collection_media`, but every media is built as soon as it is received,
+        without holding the whole page in memory. See :meth:`stream_search_photos`.
+
+        Args:
+            id (:obj:`str`): The id of the collection.
+            type (:obj:`str`, optional): The type of media you are requesting, `photos` or `videos`. Default: all media
+            page (:obj:`int`, optional): The page number you are requesting. Default: 1
+            per_page (:obj:`int`, optional): The number of results you are requesting per page. Default: 80 Max: 80
+            chunk_size (:obj:`int`, optional): Bytes read from the connection at once. Default: 16 KiB
+
+        Returns:
+            :class:`Pexels.streaming.PageStream` of :class:`Pexels.types.Photo` and :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When `per_page` is above 80.
+        """
+
+        _check_per_page(per_page)
+
+        params = {"type": type, "page": page, "per_page": per_page}
+
+        def factory(data: Dict) -> Optional[Union[Photo, Video]]:
+            # media of another type are skipped, like in CollectionMediaResponse
+            model = _MEDIA_TYPES.get(data.get("type"))
+            return model.from_dict(data, lazy=self.lazy) if model is not None else None
+
+        return self._stream(f"collections/{id}", "photo", params, "media", factory, chunk_size)
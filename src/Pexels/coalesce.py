@@ -0,0 +1,85 @@
+"""Coalescing of identical requests in flight"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    This object makes sure only one call per key runs at a time.
+    Callers arriving while the call of their key is in flight wait for it and share its result or exception,
+    instead of running their own.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", coalesce=True)
+    """
+
+    calls: int
+    "Number of calls actually run."
+    coalesced: int
+    "Number of calls answered with the result of a call already in flight."
+
+    def __init__(self):
+
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run `func`, unless a call with the same key is in flight, then wait for its outcome.
+
+        Args:
+            key (:obj:`Hashable`): Identifies identical calls, e.g. a key from :func:`Pexels.cache.make_key`.
+            func (:obj:`Callable`): The call to run.
+
+        Returns:
+            The return value of `func`, or of the call in flight.
+
+        Raises:
+            Exception: Whatever `func`, or the call in flight, raised.
+        """
+
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._in_flight)}
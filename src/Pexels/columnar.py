@@ -0,0 +1,217 @@
+"""Columnar export of result pages, for vectorized filtering and sorting"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from Pexels.errors import PexelsError
+from Pexels.types import LazyList, PhotoResponse, VideoResponse
+
+PHOTO_COLUMNS: List[Tuple[str, str]] = [
+    ('id', 'int64'),
+    ('width', 'int32'),
+    ('height', 'int32'),
+    ('photographer_id', 'int64'),
+    ('avg_color_r', 'uint8'),
+    ('avg_color_g', 'uint8'),
+    ('avg_color_b', 'uint8'),
+    ('aspect_ratio', 'float64'),
+]
+"Columns returned by :func:`photo_columns`, with their type. Missing numbers are 0."
+
+VIDEO_COLUMNS: List[Tuple[str, str]] = [
+    ('id', 'int64'),
+    ('width', 'int32'),
+    ('height', 'int32'),
+    ('duration', 'int32'),
+    ('aspect_ratio', 'float64'),
+]
+"Columns returned by :func:`video_columns`, with their type. Missing numbers are 0."
+
+VIDEO_FILE_COLUMNS: List[Tuple[str, str]] = [
+    ('video_id', 'int64'),
+    ('id', 'int64'),
+    ('width', 'int32'),
+    ('height', 'int32'),
+    ('quality', 'string'),
+    ('file_type', 'string'),
+]
+"""Columns returned by :func:`video_file_columns`, with their type, one row per :class:`Pexels.types.VideoFiles`.
+Missing numbers are 0 and missing strings are empty."""
+
+_ARRAY_TYPECODES = {'int64': 'q', 'int32': 'i', 'uint8': 'B', 'float64': 'd'}
+
+Page = Union[PhotoResponse, VideoResponse, Dict[str, Any]]
+
+
+def hex_to_rgb(color: Optional[str]) -> Tuple[int, int, int]:
+    """
+    Decode a ``#RRGGBB`` or ``#RGB`` color, as found in `avg_color`, to integers.
+    Missing or invalid colors decode to black.
+
+    Args:
+        color (:obj:`str`): The hexadecimal color.
+
+    Returns:
+        :obj:`tuple` of red, green and blue between 0 and 255.
+    """
+
+    if not color:
+        return 0, 0, 0
+    color = color.lstrip('#')
+    if len(color) == 3:
+        color = ''.join(char * 2 for char in color)
+    try:
+        value = int(color, 16)
+    except ValueError:
+        return 0, 0, 0
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+def _items(pages: Union[Page, Iterable[Page]], name: str) -> Iterable[Any]:
+    # accept one page or many, decoded dicts or responses, and prefer the raw dicts when available
+    if isinstance(pages, (dict, PhotoResponse, VideoResponse)):
+        pages = [pages]
+    for page in pages:
+        if isinstance(page, dict):
+            yield from page.get(name, ())
+            continue
+        items = getattr(page, name)
+        yield from items.raw if isinstance(items, LazyList) else items
+
+
+def _get(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name)
+
+
+def _to_backend(columns: Dict[str, list], spec: List[Tuple[str, str]], backend: Optional[str]) -> Any:
+    if backend is None:
+        backend = 'numpy' if numpy is not None else 'array'
+
+    if backend == 'array':
+        return {
+            name: array(_ARRAY_TYPECODES[kind], columns[name]) if kind in _ARRAY_TYPECODES else columns[name]
+            for name, kind in spec
+        }
+    if backend == 'numpy':
+        if numpy is None:
+            raise PexelsError("numpy is not installed, install it using pip install numpy")
+        # strings are as wide as the longest one of their column, so none is truncated
+        dtype = [
+            (name, f"U{max(map(len, columns[name]), default=0) or 1}" if kind == 'string' else kind)
+            for name, kind in spec
+        ]
+        result = numpy.empty(len(columns[spec[0][0]]), dtype=dtype)
+        for name, kind in spec:
+            result[name] = columns[name]
+        return result
+    if backend == 'arrow':
+        if pyarrow is None:
+            raise PexelsError("pyarrow is not installed, install it using pip install pyarrow")
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(columns[name], type=getattr(pyarrow, kind)()) for name, kind in spec],
+            names=[name for name, kind in spec]
+        )
+    raise PexelsError("Invalid backend given, supported ones are numpy, arrow and array.")
+
+
+def photo_columns(pages: Union[Page, Iterable[Page]], backend: Optional[str] = None) -> Any:
+    """
+    Flatten the photos of one or many pages into typed columns, see :obj:`PHOTO_COLUMNS`.
+
+    .. code:: python
+
+        table = photo_columns(client.search_photos("Nature", per_page=80))
+        wide = table[table["aspect_ratio"] > 1.5]
+
+    Args:
+        pages: A :class:`Pexels.types.PhotoResponse`, its decoded JSON, or an iterable of them.
+        backend (:obj:`str`, optional): ``numpy`` for a structured array, ``arrow`` for a
+            :class:`pyarrow.RecordBatch` or ``array`` for a dict of :class:`array.array`.
+            Default: ``numpy`` when installed, else ``array``.
+
+    Returns:
+        The columns in the requested backend.
+
+    Raises:
+        PexelsError: When the requested backend is not installed.
+    """
+
+    columns = {name: [] for name, kind in PHOTO_COLUMNS}
+    for photo in _items(pages, 'photos'):
+        width, height = _get(photo, 'width') or 0, _get(photo, 'height') or 0
+        red, green, blue = hex_to_rgb(_get(photo, 'avg_color'))
+        columns['id'].append(_get(photo, 'id'))
+        columns['width'].append(width)
+        columns['height'].append(height)
+        columns['photographer_id'].append(_get(photo, 'photographer_id') or 0)
+        columns['avg_color_r'].append(red)
+        columns['avg_color_g'].append(green)
+        columns['avg_color_b'].append(blue)
+        columns['aspect_ratio'].append(width / height if height else 0.0)
+    return _to_backend(columns, PHOTO_COLUMNS, backend)
+
+
+def video_columns(pages: Union[Page, Iterable[Page]], backend: Optional[str] = None) -> Any:
+    """
+    Flatten the videos of one or many pages into typed columns, see :obj:`VIDEO_COLUMNS`.
+
+    Args:
+        pages: A :class:`Pexels.types.VideoResponse`, its decoded JSON, or an iterable of them.
+        backend (:obj:`str`, optional): ``numpy``, ``arrow`` or ``array``, see :func:`photo_columns`.
+
+    Returns:
+        The columns in the requested backend.
+
+    Raises:
+        PexelsError: When the requested backend is not installed.
+    """
+
+    columns = {name: [] for name, kind in VIDEO_COLUMNS}
+    for video in _items(pages, 'videos'):
+        width, height = _get(video, 'width') or 0, _get(video, 'height') or 0
+        columns['id'].append(_get(video, 'id'))
+        columns['width'].append(width)
+        columns['height'].append(height)
+        columns['duration'].append(_get(video, 'duration') or 0)
+        columns['aspect_ratio'].append(width / height if height else 0.0)
+    return _to_backend(columns, VIDEO_COLUMNS, backend)
+
+
+def video_file_columns(pages: Union[Page, Iterable[Page]], backend: Optional[str] = None) -> Any:
+    """
+    Flatten every rendition of the videos of one or many pages into typed columns,
+    one row per :class:`Pexels.types.VideoFiles`, see :obj:`VIDEO_FILE_COLUMNS`.
+
+    Args:
+        pages: A :class:`Pexels.types.VideoResponse`, its decoded JSON, or an iterable of them.
+        backend (:obj:`str`, optional): ``numpy``, ``arrow`` or ``array``, see :func:`photo_columns`.
+
+    Returns:
+        The columns in the requested backend.
+
+    Raises:
+        PexelsError: When the requested backend is not installed.
+    """
+
+    columns = {name: [] for name, kind in VIDEO_FILE_COLUMNS}
+    for video in _items(pages, 'videos'):
+        video_id = _get(video, 'id')
+        video_files = _get(video, 'video_files')
+        for video_file in video_files.raw if isinstance(video_files, LazyList) else video_files:
+            columns['video_id'].append(video_id)
+            columns['id'].append(_get(video_file, 'id'))
+            columns['width'].append(_get(video_file, 'width') or 0)
+            columns['height'].append(_get(video_file, 'height') or 0)
+            columns['quality'].append(_get(video_file, 'quality') or '')
+            columns['file_type'].append(_get(video_file, 'file_type') or '')
+    return _to_backend(columns, VIDEO_FILE_COLUMNS, backend)
@@ -0,0 +1,66 @@
+"""JSON decoders for response bodies"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+from Pexels.errors import PexelsError
+
+DECODERS = ('orjson', 'msgspec', 'ujson', 'json')
+"Names of the supported decoders, fastest first."
+
+
+def get_decoder(name: Optional[str] = None) -> Callable[[bytes], Any]:
+    """
+    Return a function decoding a JSON body given as :obj:`bytes`.
+    Every decoder raises a :obj:`ValueError` on invalid JSON.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", json_decoder="orjson")
+
+    Args:
+        name (:obj:`str`, optional): One of :obj:`DECODERS`.
+            Default: the fastest installed one, the standard library :mod:`json` at worst.
+
+    Returns:
+        :obj:`Callable`
+
+    Raises:
+        PexelsError: When the decoder is unknown or not installed.
+    """
+
+    if name is None:
+        name = next(name for name, module in (
+            ('orjson', orjson), ('msgspec', msgspec), ('ujson', ujson), ('json', json)
+        ) if module is not None)
+
+    if name == 'orjson':
+        if orjson is None:
+            raise PexelsError("orjson is not installed, install it using pip install orjson")
+        return orjson.loads
+    if name == 'msgspec':
+        if msgspec is None:
+            raise PexelsError("msgspec is not installed, install it using pip install msgspec")
+        return msgspec.json.Decoder().decode
+    if name == 'ujson':
+        if ujson is None:
+            raise PexelsError("ujson is not installed, install it using pip install ujson")
+        return ujson.loads
+    if name == 'json':
+        return json.loads
+    raise PexelsError(f"Invalid json_decoder given, supported ones are {', '.join(DECODERS)}.")
@@ -0,0 +1,463 @@
+"""Streaming downloads of photos and videos"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+from urllib.parse import unquote, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Pexels.errors import PexelsError
+from Pexels.types import Photo, Src, Video, VideoFiles
+
+CHUNK_SIZE: int = 1024 * 1024
+"Number of bytes read from the connection and written to disk at once."
+
+Media = Union[Photo, Src, Video, VideoFiles, str]
+
+
+def media_url(media: Media, variant: str = "original") -> str:
+    """
+    Return the URL to download for a media.
+
+    Args:
+        media: A :class:`Pexels.types.Photo`, :class:`Pexels.types.Src`, :class:`Pexels.types.Video`,
+            :class:`Pexels.types.VideoFiles` or a URL.
+        variant (:obj:`str`, optional): For photos, the :class:`Pexels.types.Src` attribute to download.
+            For videos, the quality of the rendition (`sd`, `hd` or `uhd`), the largest one is picked.
+            Default: original
+
+    Returns:
+        :obj:`str`
+
+    Raises:
+        PexelsError: When the variant does not exist for this media.
+    """
+
+    if isinstance(media, str):
+        return media
+    if isinstance(media, VideoFiles):
+        return media.link
+    if isinstance(media, Photo):
+        media = media.src
+    if isinstance(media, Src):
+        if variant not in Src.__slots__:
+            raise PexelsError(f"Invalid photo variant given, supported ones are {', '.join(Src.__slots__)}.")
+        return getattr(media, variant)
+    if isinstance(media, Video):
+        video_file = media.renditions.largest(quality=None if variant == "original" else variant)
+        if video_file is None:
+            raise PexelsError(f"No video file with quality {variant} available.")
+        return video_file.link
+    raise PexelsError("Invalid media given, expected a Photo, Src, Video, VideoFiles or URL.")
+
+
+def file_name(url: str, variant: Optional[str] = None) -> str:
+    """
+    Return the name a file is saved under in a destination directory.
+
+    Every :class:`Pexels.types.Src` variant of a photo shares the same path and only differs by its query,
+    so the name from the URL is followed by the variant, e.g. ``pexels-photo-1-large2x.jpeg``,
+    or by a hash of the query when no variant is given.
+
+    Args:
+        url (:obj:`str`): The URL of the file.
+        variant (:obj:`str`, optional): The variant given to :func:`media_url`.
+
+    Returns:
+        :obj:`str`
+    """
+
+    parts = urlsplit(url)
+    name = unquote(os.path.basename(parts.path)) or "download"
+    if variant and variant != "original":
+        suffix = variant
+    elif parts.query:
+        suffix = hashlib.sha1(parts.query.encode()).hexdigest()[:8]
+    else:
+        return name
+    root, extension = os.path.splitext(name)
+    return f"{root}-{suffix}{extension}"
+
+
+def _destination(url: str, dest: str, variant: Optional[str] = None) -> str:
+    if os.path.isdir(dest):
+        return os.path.join(dest, file_name(url, variant))
+    return dest
+
+
+def _read_meta(part: str) -> Dict[str, Optional[str]]:
+    try:
+        with open(part + ".json", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(part: str, url: str, req: requests.Response) -> None:
+    # what the partial file was received from, so it is only resumed with the same version of the same file
+    meta = {"url": url, "etag": req.headers.get("ETag"), "last_modified": req.headers.get("Last-Modified")}
+    with open(part + ".json", "w", encoding="utf-8") as file:
+        json.dump(meta, file)
+
+
+def _remove_part(part: str) -> None:
+    for path in (part, part + ".json"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _validator(meta: Dict[str, Optional[str]]) -> Optional[str]:
+    # If-Range only accepts a strong ETag or a date
+    etag = meta.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return meta.get("last_modified")
+
+
+def _total_size(req: requests.Response, offset: int) -> Optional[int]:
+    content_range = req.headers.get("Content-Range", "")
+    if "/" in content_range and not content_range.endswith("/*"):
+        return int(content_range.rsplit("/", 1)[1])
+    if "Content-Length" in req.headers and "Content-Encoding" not in req.headers:
+        return offset + int(req.headers["Content-Length"])
+    return None
+
+
+def download(
+    session: requests.Session,
+    url: str,
+    dest: str,
+    chunk_size: int = CHUNK_SIZE,
+    expected_size: Optional[int] = None,
+    resume: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+    segments: int = 1,
+    variant: Optional[str] = None,
+    **kwargs
+) -> str:
+    """
+    Stream a file to disk in chunks of `chunk_size` bytes, so memory stays flat whatever the file size.
+
+    The data is written to ``<dest>.part`` and renamed to `dest` once complete. The URL, `ETag` and
+    `Last-Modified` of the response are kept in ``<dest>.part.json``. When a partial file is left from an
+    earlier attempt on the same URL, only the missing bytes are requested with a HTTP `Range` and `If-Range`,
+    so a file changed in between is received again from the start. Otherwise the partial file is discarded.
+
+    With `segments` above 1 and a server advertising `Accept-Ranges: bytes`, the file is split in as many
+    byte ranges, fetched on parallel connections and written at their offset in a preallocated file.
+    Otherwise it falls back to a single stream. Segmented downloads are not resumed.
+
+    Args:
+        session (:class:`requests.Session`): The session to download with.
+        url (:obj:`str`): The URL of the file.
+        dest (:obj:`str`): The destination file, or a directory to keep the name from the URL, see :func:`file_name`.
+        chunk_size (:obj:`int`, optional): Number of bytes read and written at once. Default: 1 MiB
+        expected_size (:obj:`int`, optional): Size the file must have, the size announced by the server
+            is checked when not given.
+        resume (:obj:`bool`, optional): Whether to continue a partial file. Default: True
+        progress (:obj:`Callable`, optional): Called with the number of bytes of every chunk written.
+        segments (:obj:`int`, optional): The number of ranges fetched in parallel. Default: 1
+        variant (:obj:`str`, optional): The variant of the media, added to the file name when `dest` is a directory.
+        **kwargs: Passed to :meth:`requests.Session.get`, e.g. `timeout`.
+
+    Returns:
+        :obj:`str`: The path of the downloaded file.
+
+    Raises:
+        PexelsError: When the server answers with an error or the size of the file is wrong.
+    """
+
+    dest = _destination(url, dest, variant)
+    part = dest + ".part"
+    if segments > 1:
+        probe = session.head(url, allow_redirects=True, **kwargs)
+        size = probe.headers.get("Content-Length", "")
+        size = int(size) if size.isdigit() else 0
+        # below one chunk per segment the extra connections cost more than they bring
+        segments = min(segments, size // chunk_size)
+        if probe.status_code == 200 and probe.headers.get("Accept-Ranges") == "bytes" and segments > 1:
+            _remove_part(part)
+            _download_segments(session, probe.url, part, size, segments, chunk_size, progress, **kwargs)
+            return _finish(url, part, dest, expected_size, size)
+
+    offset = 0
+    headers = {}
+    meta = {}
+    if os.path.exists(part):
+        meta = _read_meta(part)
+        validator = _validator(meta)
+        if resume and meta.get("url") == url and validator:
+            offset = os.path.getsize(part)
+            headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+        else:
+            _remove_part(part)
+
+    with session.get(url, headers=headers, stream=True, **kwargs) as req:
+        if req.status_code == 416 and offset:
+            # the partial file is already complete, or larger than the remote one
+            total = _total_size(req, 0)
+            if total != offset:
+                _remove_part(part)
+                return download(session, url, dest, chunk_size, expected_size, resume, progress, variant=variant, **kwargs)
+        elif req.status_code == 206 and offset and req.headers.get("ETag", meta.get("etag")) != meta.get("etag"):
+            # If-Range was ignored and the file changed since the partial one was received
+            _remove_part(part)
+            return download(session, url, dest, chunk_size, expected_size, resume, progress, variant=variant, **kwargs)
+        elif req.status_code in [200, 206]:
+            if req.status_code == 200:
+                offset = 0
+                _write_meta(part, url, req)
+            total = _total_size(req, offset)
+            with open(part, "ab" if offset else "wb") as file:
+                for chunk in req.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+                    if progress is not None:
+                        progress(len(chunk))
+        else:
+            raise PexelsError(f"{req.status_code} : {req.reason}")
+
+    return _finish(url, part, dest, expected_size, total)
+
+
+def _finish(url: str, part: str, dest: str, expected_size: Optional[int], total: Optional[int]) -> str:
+    size = os.path.getsize(part)
+    expected_size = expected_size if expected_size is not None else total
+    if expected_size is not None and size != expected_size:
+        if size > expected_size:
+            _remove_part(part)
+        raise PexelsError(f"Downloaded {size} bytes instead of {expected_size} for {url}")
+
+    os.replace(part, dest)
+    if os.path.exists(part + ".json"):
+        os.remove(part + ".json")
+    return dest
+
+
+def _download_segments(
+    session: requests.Session,
+    url: str,
+    part: str,
+    size: int,
+    segments: int,
+    chunk_size: int,
+    progress: Optional[Callable[[int], None]],
+    **kwargs
+) -> None:
+    with open(part, "wb") as file:
+        file.truncate(size)
+
+    step = -(-size // segments)
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+    def fetch(byte_range):
+        start, end = byte_range
+        headers = {"Range": f"bytes={start}-{end}"}
+        with session.get(url, headers=headers, stream=True, **kwargs) as req, open(part, "r+b") as file:
+            if req.status_code != 206:
+                raise PexelsError(f"{req.status_code} : {req.reason}, expected a partial content for {url}")
+            file.seek(start)
+            written = 0
+            for chunk in req.iter_content(chunk_size=chunk_size):
+                file.write(chunk[:end - start + 1 - written])
+                written += len(chunk)
+                if progress is not None:
+                    progress(len(chunk))
+        if written != end - start + 1:
+            raise PexelsError(f"Downloaded {written} bytes instead of {end - start + 1} for range {start}-{end} of {url}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            list(executor.map(fetch, ranges))
+    except BaseException:
+        os.remove(part)
+        raise
+
+
+class DownloadResult(NamedTuple):
+    """The outcome of one download of a :class:`DownloadManager`."""
+
+    media: Media
+    "The media given to the manager."
+    path: Optional[str]
+    "The downloaded file, `None` when it failed."
+    size: int
+    "The size of the file in bytes."
+    attempts: int
+    "The number of attempts made, 0 when the file was already on disk."
+    error: Optional[Exception]
+    "The last error, when every attempt failed."
+
+
+class DownloadProgress(NamedTuple):
+    """A snapshot of the progress of a :class:`DownloadManager`, given to its `progress` callback."""
+
+    done: int
+    "The number of media finished, including skipped and failed ones."
+    total: int
+    "The number of media to download."
+    failed: int
+    "The number of media which could not be downloaded."
+    skipped: int
+    "The number of media already complete on disk."
+    bytes: int
+    "The number of bytes received so far."
+    bytes_per_second: float
+    "The average throughput since the start."
+
+
+class DownloadManager:
+    """
+    This object downloads many photos and videos at once, on a bounded pool of worker threads
+    sharing one session whose connection pool is sized for them.
+
+    .. code:: python
+
+        manager = DownloadManager("downloads/", variant="large2x", workers=16)
+        results = manager.run(client.iter_search_photos("Nature"))
+
+    Note:
+        * Files already present in `dest` are skipped when their size is the one announced by the server,
+          partial files are resumed. The file names carry the variant, see :func:`file_name`.
+
+        * Media of a batch saved to the same file are downloaded once, the others wait for it.
+
+        * A failed file is retried on its own, it does not stop or restart the batch.
+
+    Args:
+        dest (:obj:`str`): The directory to write the files to, created when missing.
+        variant (:obj:`str` or :obj:`Callable`, optional): The variant given to :func:`media_url`, or a
+            function returning the :class:`Pexels.types.VideoFiles`, :class:`Pexels.types.Src` variant URL
+            or URL to download for a media. Default: original
+        workers (:obj:`int`, optional): The number of files downloaded at the same time. Default: 8
+        pool_size (:obj:`int`, optional): The number of connections kept open per host. Default: `workers` x `segments`
+        retries (:obj:`int`, optional): The number of extra attempts for a failed file. Default: 3
+        backoff (:obj:`float`, optional): Seconds to wait before the first retry, doubled after each one. Default: 1
+        progress (:obj:`Callable`, optional): Called with a :class:`DownloadProgress` after every chunk and file.
+        segments (:obj:`int`, optional): The number of parallel ranges per file, see :func:`download`. Default: 1
+        session (:class:`requests.Session`, optional): The session to use, a new one is created by default.
+        **kwargs: Passed to :func:`download`, e.g. `timeout` or `chunk_size`.
+    """
+
+    def __init__(
+        self,
+        dest: str,
+        variant: Union[str, Callable[[Media], Media]] = "original",
+        workers: int = 8,
+        pool_size: Optional[int] = None,
+        retries: int = 3,
+        backoff: float = 1.0,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+        segments: int = 1,
+        session: Optional[requests.Session] = None,
+        **kwargs
+    ):
+
+        self.dest = dest
+        self.variant = variant
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.progress = progress
+        self.segments = segments
+        self.kwargs = kwargs
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size or workers * segments)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self._lock = threading.Lock()
+
+    def url(self, media: Media) -> str:
+        """Return the URL downloaded for a media, according to the variant policy."""
+
+        if callable(self.variant):
+            return media_url(self.variant(media))
+        return media_url(media, self.variant)
+
+    def path(self, url: str) -> str:
+        """Return the file a URL is downloaded to."""
+
+        return os.path.join(self.dest, file_name(url, None if callable(self.variant) else self.variant))
+
+    def run(self, media: Iterable[Media]) -> List[DownloadResult]:
+        """
+        Download every media and wait for the end of the batch.
+
+        Args:
+            media: An iterable of :class:`Pexels.types.Photo`, :class:`Pexels.types.Video`,
+                :class:`Pexels.types.VideoFiles` or URLs.
+
+        Returns:
+            A :class:`DownloadResult` per media, in the same order.
+        """
+
+        media = list(media)
+        os.makedirs(self.dest, exist_ok=True)
+        self._started = time.monotonic()
+        self._state = {"done": 0, "total": len(media), "failed": 0, "skipped": 0, "bytes": 0}
+        self._path_locks = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self._download, media))
+
+    def _download(self, media: Media) -> DownloadResult:
+        error = None
+        attempts = 0
+        try:
+            url = self.url(media)
+            path = self.path(url)
+            with self._lock:
+                path_lock = self._path_locks.setdefault(path, threading.Lock())
+            # one download per file, the other media of the same file then find it complete
+            with path_lock:
+                if self._complete(url, path):
+                    self._report(done=1, skipped=1)
+                    return DownloadResult(media, path, os.path.getsize(path), 0, None)
+
+                while attempts <= self.retries:
+                    if attempts:
+                        time.sleep(self.backoff * 2 ** (attempts - 1))
+                    attempts += 1
+                    try:
+                        download(
+                            self.session, url, path,
+                            progress=lambda size: self._report(bytes=size), segments=self.segments, **self.kwargs
+                        )
+                        self._report(done=1)
+                        return DownloadResult(media, path, os.path.getsize(path), attempts, None)
+                    except (PexelsError, requests.RequestException, OSError) as exc:
+                        error = exc
+        except PexelsError as exc:
+            error = exc
+
+        self._report(done=1, failed=1)
+        return DownloadResult(media, None, 0, attempts, error)
+
+    def _complete(self, url: str, path: str) -> bool:
+        # a file of the same name is only trusted when it has the size the server announces
+        if not os.path.exists(path):
+            return False
+        try:
+            with self.session.head(url, allow_redirects=True, timeout=self.kwargs.get("timeout")) as probe:
+                if probe.status_code != 200 or "Content-Encoding" in probe.headers:
+                    return False
+                size = int(probe.headers["Content-Length"])
+        except (requests.RequestException, KeyError, ValueError):
+            return False
+        return size == os.path.getsize(path)
+
+    def _report(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                self._state[name] += value
+            state = dict(self._state)
+        if self.progress is not None:
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            self.progress(DownloadProgress(bytes_per_second=state["bytes"] / elapsed, **state))
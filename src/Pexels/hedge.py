@@ -0,0 +1,118 @@
+"""Hedged requests, to cut the tail latency of metadata calls"""
+
+import threading
+from collections import deque
+from typing import Dict, Iterable
+
+
+class HedgePolicy:
+    """
+    This object decides when a slow GET request gets a duplicate.
+
+    When a request has not answered after the `percentile` of the recent latencies of its endpoint,
+    the same request is sent again and whichever answers first is used. The other one is ignored,
+    it completes in the background and its connection goes back to the pool.
+    Hedges use rate limit budget, so they are capped to `max_ratio` of the requests.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", hedge=HedgePolicy(percentile=95, max_ratio=0.05))
+
+    Args:
+        percentile (:obj:`float`, optional): The percentile of the recent latencies to wait for. Default: 95
+        max_ratio (:obj:`float`, optional): The largest fraction of requests which may be hedged. Default: 0.05
+        min_delay (:obj:`float`, optional): The shortest wait in seconds before a hedge. Default: 0.05
+        initial_delay (:obj:`float`, optional): The wait in seconds used until `min_samples` latencies are known.
+            Default: 1
+        min_samples (:obj:`int`, optional): The number of latencies needed to use the percentile. Default: 20
+        window (:obj:`int`, optional): The number of recent latencies kept per endpoint. Default: 1000
+        endpoints (:obj:`Iterable`, optional): The endpoint names hedged, see :func:`Pexels.cache.endpoint_name`.
+            Default: ``photos/{id}`` and ``videos/{id}``
+    """
+
+    requests: int
+    "Number of requests eligible for a hedge."
+    hedged: int
+    "Number of hedges sent."
+    wins: int
+    "Number of hedges which answered before the original request."
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        max_ratio: float = 0.05,
+        min_delay: float = 0.05,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 1000,
+        endpoints: Iterable[str] = ('photos/{id}', 'videos/{id}')
+    ):
+
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.endpoints = frozenset(endpoints)
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self.window = window
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def applies(self, endpoint: str) -> bool:
+        """Whether requests to this endpoint name may be hedged."""
+        return endpoint in self.endpoints
+
+    def begin(self, endpoint: str) -> float:
+        """
+        Count an eligible request and return the seconds to wait for it before hedging.
+
+        Args:
+            endpoint (:obj:`str`): The endpoint name of the request.
+        """
+
+        with self._lock:
+            self.requests += 1
+            latencies = self._latencies.get(endpoint, ())
+            if len(latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(latencies)
+        index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+        return max(latencies[index], self.min_delay)
+
+    def allow(self) -> bool:
+        """Count a hedge and return `True`, unless it would exceed `max_ratio`."""
+
+        with self._lock:
+            if self.hedged + 1 > self.max_ratio * self.requests:
+                return False
+            self.hedged += 1
+            return True
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a completed request, original or hedge.
+
+        Args:
+            endpoint (:obj:`str`): The endpoint name of the request.
+            latency (:obj:`float`): Seconds the request took, from the moment it was sent.
+        """
+
+        with self._lock:
+            if endpoint not in self._latencies:
+                self._latencies[endpoint] = deque(maxlen=self.window)
+            self._latencies[endpoint].append(latency)
+
+    def won(self) -> None:
+        """Count a hedge which answered before the original request."""
+
+        with self._lock:
+            self.wins += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return the counters as a dict."""
+
+        with self._lock:
+            return {'requests': self.requests, 'hedged': self.hedged, 'wins': self.wins}
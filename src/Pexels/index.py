@@ -0,0 +1,309 @@
+"""Local full-text index of harvested photos and videos"""
+
+import colorsys
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from Pexels.columnar import hex_to_rgb
+from Pexels.constants import COLOR, ORIENTATION, SIZE
+from Pexels.errors import PexelsError
+from Pexels.types import CollectionMediaResponse, LazyList, Photo, PhotoResponse, Video, VideoResponse
+
+MIN_PIXELS: Dict[str, Dict[str, int]] = {
+    'photos': {'large': 24_000_000, 'medium': 12_000_000, 'small': 4_000_000},
+    'videos': {'large': 3840 * 2160, 'medium': 1920 * 1080, 'small': 1280 * 720},
+}
+"Minimum number of pixels of every `size`, 24, 12 and 4 MP for photos and 4K, Full HD and HD for videos."
+
+COLOR_DISTANCE: float = 60
+"Largest distance in RGB space between `avg_color` and a hexadecimal `color` filter."
+
+Indexable = Union[Photo, Video, PhotoResponse, VideoResponse, CollectionMediaResponse, Dict[str, Any]]
+
+_MEDIA_TYPES = {'photos': 'Photo', 'videos': 'Video'}
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def color_name(color: Optional[str]) -> str:
+    """
+    Name the color of an `avg_color`, as one of :obj:`Pexels.constants.COLOR`.
+
+    Args:
+        color (:obj:`str`): The hexadecimal color, e.g. ``#978E82``.
+
+    Returns:
+        :obj:`str`
+    """
+
+    red, green, blue = hex_to_rgb(color)
+    hue, saturation, value = colorsys.rgb_to_hsv(red / 255, green / 255, blue / 255)
+    hue *= 360
+    if value < 0.2:
+        return 'black'
+    if saturation < 0.15:
+        return 'white' if value > 0.85 else 'gray'
+    if 15 <= hue < 45 and value < 0.6:
+        return 'brown'
+    for name, end in (('red', 15), ('orange', 45), ('yellow', 70), ('green', 160), ('turquoise', 200),
+                      ('blue', 260), ('violet', 300), ('pink', 345)):
+        if hue < end:
+            if name == 'red' and saturation < 0.5 and value > 0.7:
+                return 'pink'
+            return name
+    return 'red'
+
+
+def _orientation(width: int, height: int) -> str:
+    if width > height:
+        return 'landscape'
+    if height > width:
+        return 'portrait'
+    return 'square'
+
+
+def _slug(url: Optional[str]) -> str:
+    # the page URL ends with a description, e.g. /photo/brown-rocks-during-golden-hour-2014422/
+    segments = [segment for segment in urlsplit(url or '').path.split('/') if segment]
+    return ' '.join(word for word in segments[-1].split('-') if not word.isdigit()) if len(segments) > 1 else ''
+
+
+def _items(obj: Indexable) -> Iterable[Dict[str, Any]]:
+    # the media of a response or a single media, as decoded JSON
+    if isinstance(obj, (Photo, Video)):
+        yield obj.to_dict()
+        return
+    if isinstance(obj, dict):
+        # a decoded page holds its media in one of these, a decoded media is yielded as is
+        for name in ('photos', 'videos', 'media'):
+            if isinstance(obj.get(name), list):
+                yield from obj[name]
+                return
+        yield obj
+        return
+    for name in ('photos', 'videos', 'media'):
+        items = getattr(obj, name, None)
+        if items is not None:
+            yield from items.raw if isinstance(items, LazyList) else (item.to_dict() for item in items)
+
+
+class LocalIndex:
+    """
+    This object represents a searchable store of the photos and videos already received,
+    kept in a SQLite database with a FTS5 full-text index.
+
+    Photos are indexed by `alt`, photographer and the description in their URL, videos by
+    videographer and the description in their URL. :meth:`search_local` filters them like
+    :meth:`Pexels.client.Client.search_photos` does, without any request.
+
+    .. code:: python
+
+        index = LocalIndex("~/.cache/pexels-index.sqlite")
+        client = Client(token="abcde12345", index=index)
+        client.search_photos("Nature", per_page=80)
+        photos = index.search_local("nature", orientation="landscape", color="green")
+
+    Note:
+        * The API matches colors on the whole photo, only `avg_color` is known locally.
+          A color name matches the photos whose `avg_color` has that name, see :func:`color_name`,
+          and a hexadecimal color matches within :obj:`COLOR_DISTANCE`.
+
+    Args:
+        path (:obj:`str`, optional): Path of the SQLite database, created when missing. Default: in memory
+        timeout (:obj:`float`, optional): Seconds to wait for a lock held by another process. Default: 30
+
+    Raises:
+        PexelsError: When the sqlite3 module was built without FTS5.
+    """
+
+    def __init__(self, path: str = ":memory:", timeout: float = 30):
+
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        self._lock = threading.Lock()
+        # one connection shared under a lock, an in-memory database can not be opened twice
+        self._conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS media ("
+                    "type TEXT NOT NULL, id INTEGER NOT NULL, width INTEGER, height INTEGER, pixels INTEGER, "
+                    "orientation TEXT, red INTEGER, green INTEGER, blue INTEGER, color TEXT, duration INTEGER, "
+                    "data TEXT NOT NULL, indexed REAL NOT NULL, PRIMARY KEY (type, id))"
+                )
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS media_text USING fts5(alt, author, description)"
+                )
+        except sqlite3.OperationalError as exc:
+            raise PexelsError(f"LocalIndex requires SQLite with FTS5: {exc}") from exc
+
+    def add(self, obj: Indexable) -> int:
+        """
+        Store or update photos and videos.
+
+        Args:
+            obj: A :class:`Pexels.types.Photo`, :class:`Pexels.types.Video`, a response holding them,
+                or their decoded JSON.
+
+        Returns:
+            :obj:`int` number of media stored.
+        """
+
+        now = time.time()
+        count = 0
+        with self._lock, self._conn:
+            for item in _items(obj):
+                media_type = item.get('type') or ('Video' if 'video_files' in item else 'Photo')
+                if media_type not in ('Photo', 'Video'):
+                    continue
+                self._store(media_type, item, now)
+                count += 1
+        return count
+
+    def _store(self, media_type: str, item: Dict[str, Any], now: float) -> None:
+        width, height = item.get('width') or 0, item.get('height') or 0
+        avg_color = item.get('avg_color')
+        red, green, blue = hex_to_rgb(avg_color) if avg_color else (None, None, None)
+        if media_type == 'Photo':
+            texts = (item.get('alt') or '', item.get('photographer') or '', _slug(item.get('url')))
+        else:
+            texts = ('', (item.get('user') or {}).get('name') or '', _slug(item.get('url')))
+
+        row = self._conn.execute("SELECT rowid FROM media WHERE type = ? AND id = ?", (media_type, item['id'])).fetchone()
+        values = (
+            width, height, width * height, _orientation(width, height), red, green, blue,
+            color_name(avg_color) if avg_color else None, item.get('duration'), json.dumps(item), now
+        )
+        if row is None:
+            cursor = self._conn.execute(
+                "INSERT INTO media (type, id, width, height, pixels, orientation, red, green, blue, color, "
+                "duration, data, indexed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (media_type, item['id'], *values)
+            )
+            self._conn.execute("INSERT INTO media_text (rowid, alt, author, description) VALUES (?, ?, ?, ?)",
+                               (cursor.lastrowid, *texts))
+        else:
+            self._conn.execute(
+                "UPDATE media SET width = ?, height = ?, pixels = ?, orientation = ?, red = ?, green = ?, blue = ?, "
+                "color = ?, duration = ?, data = ?, indexed = ? WHERE rowid = ?",
+                (*values, row[0])
+            )
+            self._conn.execute("UPDATE media_text SET alt = ?, author = ?, description = ? WHERE rowid = ?",
+                               (*texts, row[0]))
+
+    def search_local(
+        self,
+        query: str = "",
+        orientation: Optional[str] = "",
+        size: Optional[str] = "",
+        color: Optional[str] = "",
+        type: Optional[str] = "photos",
+        limit: Optional[int] = 80
+    ) -> List[Union[Photo, Video]]:
+        """
+        Search the stored media, best matches first.
+
+        Args:
+            query (:obj:`str`, optional): Words which must all appear in the alt text, author or description.
+                Default: every media
+            orientation (:obj:`str`, optional): Desired orientation, see :obj:`Pexels.constants.ORIENTATION`.
+            size (:obj:`str`, optional): Minimum size, see :obj:`Pexels.constants.SIZE` and :obj:`MIN_PIXELS`.
+            color (:obj:`str`, optional): A color of :obj:`Pexels.constants.COLOR` or a hexadecimal code.
+            type (:obj:`str`, optional): `photos`, `videos` or empty for both. Default: `photos`
+            limit (:obj:`int`, optional): The maximum number of results, `None` for all. Default: 80
+
+        Returns:
+            :obj:`list` of :class:`Pexels.types.Photo` and :class:`Pexels.types.Video`
+
+        Raises:
+            PexelsError: When invalid `orientation`, `size`, `color` or `type` given.
+        """
+
+        if orientation and orientation not in ORIENTATION:
+            raise PexelsError("Invalid value given for orientation, supported ones are landscape, portrait and square.")
+        if size and size not in SIZE:
+            raise PexelsError("Invalid photo size given, the supported ones are large, medium and small.")
+        if type and type not in _MEDIA_TYPES:
+            raise PexelsError("Invalid type given, supported ones are photos and videos.")
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        words = _WORD.findall(query or '')
+        if words:
+            # every word quoted, so the query is never read as FTS5 syntax
+            params.append(' '.join(f'"{word}"' for word in words))
+        if type:
+            clauses.append("media.type = ?")
+            params.append(_MEDIA_TYPES[type])
+        if orientation:
+            clauses.append("orientation = ?")
+            params.append(orientation)
+        if size:
+            # videos and photos have their own thresholds when both are searched
+            clauses.append("pixels >= CASE media.type WHEN 'Video' THEN ? ELSE ? END")
+            params += [MIN_PIXELS['videos'][size], MIN_PIXELS['photos'][size]]
+        if color:
+            clauses.append(self._color_clause(color, params))
+
+        sql = "SELECT media.type, media.data FROM media"
+        if words:
+            sql += " JOIN media_text ON media_text.rowid = media.rowid AND media_text MATCH ?"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY bm25(media_text)" if words else " ORDER BY media.indexed DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(Photo if media_type == 'Photo' else Video).from_dict(json.loads(data)) for media_type, data in rows]
+
+    def _color_clause(self, color: str, params: List[Any]) -> str:
+        if color in COLOR:
+            params.append(color)
+            return "color = ?"
+        if not re.search(r'^#(?:[0-9a-fA-F]{3}){1,2}$', color):
+            raise PexelsError("Invalid color name or hexadecimal code given.")
+        red, green, blue = hex_to_rgb(color)
+        params += [red, red, green, green, blue, blue, COLOR_DISTANCE * COLOR_DISTANCE]
+        return "(red - ?) * (red - ?) + (green - ?) * (green - ?) + (blue - ?) * (blue - ?) <= ?"
+
+    def remove(self, type: str, id: int) -> bool:
+        """
+        Remove one media.
+
+        Args:
+            type (:obj:`str`): `photos` or `videos`.
+            id (:obj:`int`): The id of the media.
+
+        Returns:
+            :obj:`bool` whether it was stored.
+        """
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT rowid FROM media WHERE type = ? AND id = ?", (_MEDIA_TYPES.get(type, type), id)
+            ).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM media WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM media_text WHERE rowid = ?", row)
+        return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM media").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,295 @@
+"""Instrumentation of the requests made by a client"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import requests
+
+from Pexels.cache import endpoint_name
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"Upper bounds in seconds of the latency histogram buckets, the Prometheus defaults."
+
+
+class RequestEvent(NamedTuple):
+    """A finished attempt, given to the `after_request` hooks of :class:`Metrics`."""
+
+    method: str
+    "The HTTP method of the request."
+    url: str
+    "The URL of the request."
+    endpoint: str
+    "The endpoint name, see :func:`Pexels.cache.endpoint_name`."
+    elapsed: float
+    "Seconds spent on the network, until the whole body was received."
+    status: Optional[int]
+    "The status code, `None` when the attempt raised."
+    size: int
+    "The size of the response body in bytes."
+    error: Optional[Exception]
+    "The exception raised instead of a response."
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, in the layout of Prometheus.
+
+    Args:
+        buckets (:obj:`Iterable`): The upper bounds of the buckets, ascending.
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one value."""
+
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the count, the sum and the cumulative count of every bucket."""
+
+        cumulative = {}
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            cumulative[bound] = total
+        return {'count': self.count, 'sum': self.sum, 'buckets': cumulative}
+
+
+class _Endpoint:
+
+    __slots__ = ('latency', 'decode', 'statuses', 'errors', 'bytes', 'cache_hits')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.latency = Histogram(buckets)
+        self.decode = Histogram(buckets)
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bytes = 0
+        self.cache_hits = 0
+
+
+class Metrics:
+    """
+    This object collects what a :class:`Pexels.client.Client` does, per endpoint:
+    network latency, status codes, exceptions, response sizes, cache hits and JSON decode time.
+    The time spent building the models is kept per model, and the latest rate limit values are kept too.
+
+    Network time covers one attempt, so a retried request is observed once per attempt.
+    Requests answered by a cache never reach the network and only count as cache hits.
+
+    .. code:: python
+
+        metrics = Metrics(after_request=[lambda event: print(event.endpoint, event.elapsed)])
+        client = Client(token="abcde12345", metrics=metrics)
+        client.search_photos("Nature")
+        print(metrics.snapshot()["endpoints"]["search"]["latency"])
+
+    Args:
+        buckets (:obj:`Iterable`, optional): Upper bounds in seconds of the histogram buckets.
+            Default: :obj:`DEFAULT_BUCKETS`
+        before_request (:obj:`list`, optional): Called with the method and the URL before every attempt.
+        after_request (:obj:`list`, optional): Called with a :class:`RequestEvent` after every attempt.
+    """
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        before_request: Optional[List[Callable[[str, str], None]]] = None,
+        after_request: Optional[List[Callable[[RequestEvent], None]]] = None
+    ):
+
+        self.buckets = tuple(sorted(buckets))
+        self.before_request = list(before_request or [])
+        self.after_request = list(after_request or [])
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._builds: Dict[str, Histogram] = {}
+        self._rate_limit: Dict[str, Optional[int]] = {'limit': None, 'remaining': None, 'reset': None}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, url: str) -> _Endpoint:
+        # called with the lock held
+        name = endpoint_name(url)
+        endpoint = self._endpoints.get(name)
+        if endpoint is None:
+            endpoint = self._endpoints[name] = _Endpoint(self.buckets)
+        return endpoint
+
+    def request_started(self, method: str, url: str) -> None:
+        """Run the `before_request` hooks for an attempt about to be sent."""
+
+        for hook in self.before_request:
+            hook(method, url)
+
+    def request_finished(
+        self,
+        method: str,
+        url: str,
+        elapsed: float,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+        size: Optional[int] = None
+    ) -> None:
+        """
+        Record an attempt and run the `after_request` hooks.
+
+        Args:
+            method (:obj:`str`): The HTTP method of the request.
+            url (:obj:`str`): The URL of the request.
+            elapsed (:obj:`float`): Seconds spent on the network.
+            response (:obj:`requests.Response`, optional): The response received.
+            error (:obj:`Exception`, optional): The exception raised instead of a response.
+            size (:obj:`int`, optional): The size of the body. Default: the length of its content
+        """
+
+        status = response.status_code if response is not None else None
+        if size is None:
+            size = len(response.content or b'') if response is not None else 0
+        with self._lock:
+            endpoint = self._endpoint(url)
+            endpoint.latency.observe(elapsed)
+            endpoint.bytes += size
+            if status is not None:
+                endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            if error is not None:
+                name = type(error).__name__
+                endpoint.errors[name] = endpoint.errors.get(name, 0) + 1
+
+        if self.after_request:
+            event = RequestEvent(method, url, endpoint_name(url), elapsed, status, size, error)
+            for hook in self.after_request:
+                hook(event)
+
+    def cache_hit(self, url: str) -> None:
+        """Count a request answered by a cache."""
+
+        with self._lock:
+            self._endpoint(url).cache_hits += 1
+
+    def observe_decode(self, url: str, elapsed: float) -> None:
+        """Record the seconds spent decoding the JSON body of a response."""
+
+        with self._lock:
+            self._endpoint(url).decode.observe(elapsed)
+
+    def observe_build(self, model: str, elapsed: float) -> None:
+        """Record the seconds spent building a model, e.g. ``PhotoResponse``, from decoded JSON."""
+
+        with self._lock:
+            histogram = self._builds.get(model)
+            if histogram is None:
+                histogram = self._builds[model] = Histogram(self.buckets)
+            histogram.observe(elapsed)
+
+    def update_rate_limit(self, limit: Optional[int], remaining: Optional[int], reset: Optional[int]) -> None:
+        """Keep the latest rate limit values."""
+
+        with self._lock:
+            self._rate_limit = {'limit': limit, 'remaining': remaining, 'reset': reset}
+
+    def reset(self) -> None:
+        """Forget everything recorded, the hooks are kept."""
+
+        with self._lock:
+            self._endpoints.clear()
+            self._builds.clear()
+            self._rate_limit = {'limit': None, 'remaining': None, 'reset': None}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return everything recorded as plain dicts.
+
+        Returns:
+            :obj:`dict` with ``endpoints``, keyed by endpoint name, ``build``, keyed by model name,
+            and ``rate_limit``.
+        """
+
+        with self._lock:
+            return {
+                'endpoints': {
+                    name: {
+                        'requests': endpoint.latency.count,
+                        'latency': endpoint.latency.snapshot(),
+                        'decode': endpoint.decode.snapshot(),
+                        'statuses': dict(endpoint.statuses),
+                        'errors': dict(endpoint.errors),
+                        'bytes': endpoint.bytes,
+                        'cache_hits': endpoint.cache_hits,
+                    }
+                    for name, endpoint in self._endpoints.items()
+                },
+                'build': {model: histogram.snapshot() for model, histogram in self._builds.items()},
+                'rate_limit': dict(self._rate_limit),
+            }
+
+    def prometheus(self, prefix: str = 'pexels') -> str:
+        """
+        Return everything recorded in the Prometheus text exposition format.
+
+        Args:
+            prefix (:obj:`str`, optional): Prefix of the metric names. Default: ``pexels``
+
+        Returns:
+            :obj:`str`
+        """
+
+        snapshot = self.snapshot()
+        endpoints = snapshot['endpoints']
+        lines = []
+
+        def histogram(name: str, description: str, label: str, values: Dict[str, Dict[str, Any]]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} histogram')
+            for value, data in values.items():
+                for bound, count in data['buckets'].items():
+                    lines.append(f'{prefix}_{name}_bucket{{{label}="{value}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_{name}_bucket{{{label}="{value}",le="+Inf"}} {data["count"]}')
+                lines.append(f'{prefix}_{name}_sum{{{label}="{value}"}} {data["sum"]}')
+                lines.append(f'{prefix}_{name}_count{{{label}="{value}"}} {data["count"]}')
+
+        def counter(name: str, description: str, samples: Iterable[Tuple[str, Any]]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for labels, value in samples:
+                lines.append(f'{prefix}_{name}{{{labels}}} {value}')
+
+        histogram(
+            'request_duration_seconds', 'Network time of one attempt.', 'endpoint',
+            {name: data['latency'] for name, data in endpoints.items()}
+        )
+        histogram(
+            'decode_duration_seconds', 'Time spent decoding JSON bodies.', 'endpoint',
+            {name: data['decode'] for name, data in endpoints.items()}
+        )
+        histogram('build_duration_seconds', 'Time spent building models.', 'model', snapshot['build'])
+        counter('responses_total', 'Responses by status code.', [
+            (f'endpoint="{name}",status="{status}"', count)
+            for name, data in endpoints.items() for status, count in data['statuses'].items()
+        ])
+        counter('request_errors_total', 'Attempts which raised, by exception.', [
+            (f'endpoint="{name}",exception="{error}"', count)
+            for name, data in endpoints.items() for error, count in data['errors'].items()
+        ])
+        counter('response_bytes_total', 'Bytes of response bodies received.', [
+            (f'endpoint="{name}"', data['bytes']) for name, data in endpoints.items()
+        ])
+        counter('cache_hits_total', 'Requests answered by a cache.', [
+            (f'endpoint="{name}"', data['cache_hits']) for name, data in endpoints.items()
+        ])
+        for name, value in snapshot['rate_limit'].items():
+            if value is not None:
+                lines.append(f'# TYPE {prefix}_rate_limit_{name} gauge')
+                lines.append(f'{prefix}_rate_limit_{name} {value}')
+        return '\n'.join(lines) + '\n'
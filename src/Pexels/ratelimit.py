@@ -0,0 +1,159 @@
+"""Request scheduling driven by the rate limit headers returned by Pexels"""
+
+import threading
+import time
+from typing import Mapping, Optional
+
+from Pexels.errors import QuotaExceedError
+
+
+class RateLimiter:
+    """
+    This object keeps track of the `X-Ratelimit-Limit`, `X-Ratelimit-Remaining` and `X-Ratelimit-Reset`
+    headers of every response and paces outgoing requests with a token bucket,
+    so the remaining budget lasts until the reset time instead of running out early.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", rate_limiter=RateLimiter(burst=20))
+
+    Note:
+        * Until the first response carrying the headers is received, requests are not delayed.
+
+        * When the budget is exhausted, requests block until the reset time instead of raising
+        :class:`Pexels.errors.QuotaExceedError`, unless the wait would be longer than `max_wait`.
+
+    Args:
+        pace (:obj:`bool`, optional): Whether to delay requests at all. With `False` the headers are only recorded.
+            Default: True
+        burst (:obj:`int`, optional): The number of requests that may be sent back to back before pacing starts.
+            Default: 10
+        max_wait (:obj:`float`, optional): The longest time in seconds a request may be delayed,
+            longer waits raise :class:`Pexels.errors.QuotaExceedError`. Default: no limit
+    """
+
+    limit: Optional[int]
+    "The total number of requests allowed in the current period."
+    remaining: Optional[int]
+    "The number of requests left in the current period."
+    reset: Optional[float]
+    "UNIX timestamp at which the current period ends."
+
+    def __init__(self, pace: bool = True, burst: int = 10, max_wait: Optional[float] = None):
+
+        self.pace = pace
+        self.burst = burst
+        self.max_wait = max_wait
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self._tokens = float(burst)
+        self._rate = None
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Record the rate limit headers of a response.
+
+        Args:
+            headers (:obj:`Mapping`): The response headers.
+        """
+
+        try:
+            limit = int(headers["X-Ratelimit-Limit"])
+            remaining = int(headers["X-Ratelimit-Remaining"])
+            reset = float(headers["X-Ratelimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            now = time.time()
+            self.limit = limit
+            self.remaining = remaining
+            self.reset = reset
+            self._rate = remaining / max(reset - now, 1.0)
+            self._tokens = min(self._tokens, float(remaining))
+
+    def exhausted(self, retry_after: Optional[float] = None) -> bool:
+        """
+        Mark the budget as used up after a HTTP 429 response.
+
+        Args:
+            retry_after (:obj:`float`, optional): Seconds to wait, from the `Retry-After` header.
+
+        Returns:
+            :obj:`bool`: Whether the reset time is known, so waiting for it makes sense.
+        """
+
+        with self._lock:
+            now = time.time()
+            self.remaining = 0
+            if retry_after is not None:
+                self.reset = now + retry_after
+            return self.reset is not None and self.reset > now
+
+    def acquire(self) -> float:
+        """
+        Wait until the next request may be sent.
+
+        Returns:
+            :obj:`float`: The number of seconds waited.
+
+        Raises:
+            QuotaExceedError: When the wait would be longer than `max_wait`.
+        """
+
+        if not self.pace:
+            return 0.0
+
+        with self._lock:
+            now = time.time()
+            if self.remaining is not None and self.remaining <= 0:
+                reset = self.reset or now
+                if reset > max(now, self._updated):
+                    # the next period starts at the reset time with a full burst, the headers will correct the rest
+                    self._tokens = float(self.burst)
+                    self._updated = reset
+                self.remaining = None
+                self._rate = None
+            wait = self._take(now)
+
+        # slept without the lock, so update() and exhausted() from other threads are not blocked meanwhile
+        return self._sleep(wait)
+
+    def _take(self, now: float) -> float:
+        # token bucket, called with the lock held, returns the seconds to wait
+        if self._updated > now:
+            # the budget was exhausted and the next period has not started yet: wait for it,
+            # spending the burst it starts with, callers beyond the burst go out with it until headers arrive
+            wait = self._updated - now
+            self._check_wait(wait)
+            self._tokens -= 1.0
+            return wait
+        if self._rate:
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        else:
+            self._tokens = float(self.burst)
+        self._updated = now
+
+        wait = 0.0
+        if self._tokens < 1.0:
+            wait = (1.0 - self._tokens) / self._rate
+            self._check_wait(wait)
+        # tokens may go negative, later callers then queue behind this one
+        self._tokens -= 1.0
+        if self.remaining is not None:
+            self.remaining -= 1
+        return wait
+
+    def _check_wait(self, wait: float) -> None:
+        if self.max_wait is not None and wait > self.max_wait:
+            raise QuotaExceedError(f"You have exceeded your rate limit, next request allowed in {wait:.0f} seconds.")
+
+    @staticmethod
+    def _sleep(wait: float) -> float:
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,143 @@
+"""Retry policy for failed requests"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+import requests
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    Return the number of seconds asked by a `Retry-After` header, given in seconds or as a HTTP date.
+
+    Args:
+        headers (:obj:`Mapping`): The response headers.
+
+    Returns:
+        :obj:`float` or `None` when the header is missing or invalid.
+    """
+
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryEvent(NamedTuple):
+    """A retry about to happen, given to the `on_retry` hook of :class:`RetryPolicy`."""
+
+    method: str
+    "The HTTP method of the request."
+    url: str
+    "The URL of the request."
+    attempt: int
+    "The number of the retry, starting at 1."
+    delay: float
+    "Seconds waited before the retry."
+    status: Optional[int]
+    "The status code which caused the retry, `None` for a connection error or timeout."
+    error: Optional[Exception]
+    "The connection error or timeout which caused the retry."
+
+
+class RetryPolicy:
+    """
+    This object decides whether a failed request is sent again, and when.
+
+    Idempotent requests are retried on server errors, connection errors and read timeouts,
+    after an exponential backoff with full jitter: a random delay between 0 and
+    ``min(max_backoff, backoff * 2 ** retry)``. A `Retry-After` header on HTTP 429 and 503 is followed instead.
+
+    .. code:: python
+
+        client = Client(token="abcde12345", retry=RetryPolicy(max_retries=5, on_retry=print), timeout=10)
+
+    Args:
+        max_retries (:obj:`int`, optional): The maximum number of retries of one request. Default: 3
+        backoff (:obj:`float`, optional): The backoff of the first retry in seconds. Default: 0.5
+        max_backoff (:obj:`float`, optional): The longest backoff in seconds. Default: 30
+        total_timeout (:obj:`float`, optional): No retry is made once this many seconds passed since the
+            first attempt, or when its delay would exceed it. Default: 60
+        statuses (:obj:`Iterable`, optional): The status codes retried. Default: 500, 502, 503 and 504
+        retry_after_statuses (:obj:`Iterable`, optional): The status codes whose `Retry-After` header is followed,
+            they are retried only when it is present. Default: 429 and 503
+        methods (:obj:`Iterable`, optional): The HTTP methods retried. Default: GET and HEAD
+        on_retry (:obj:`Callable`, optional): Called with a :class:`RetryEvent` before every retry.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        total_timeout: float = 60,
+        statuses: Iterable[int] = (500, 502, 503, 504),
+        retry_after_statuses: Iterable[int] = (429, 503),
+        methods: Iterable[str] = ("GET", "HEAD"),
+        on_retry: Optional[Callable[[RetryEvent], None]] = None
+    ):
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
+        self.statuses = frozenset(statuses)
+        self.retry_after_statuses = frozenset(retry_after_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.on_retry = on_retry
+
+    def next_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        elapsed: float,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Return the seconds to wait before retrying a failed attempt, or `None` to give up.
+        The `on_retry` hook is called when a retry is decided.
+
+        Args:
+            method (:obj:`str`): The HTTP method of the request.
+            url (:obj:`str`): The URL of the request.
+            attempt (:obj:`int`): The number of retries already made.
+            elapsed (:obj:`float`): Seconds since the first attempt.
+            status (:obj:`int`, optional): The status code of the response.
+            error (:obj:`Exception`, optional): The exception raised instead of a response.
+            retry_after (:obj:`float`, optional): Seconds asked by the `Retry-After` header.
+        """
+
+        if method.upper() not in self.methods or attempt >= self.max_retries:
+            return None
+
+        if error is not None:
+            if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+                return None
+            delay = self._jitter(attempt)
+        elif status in self.retry_after_statuses and retry_after is not None:
+            delay = retry_after
+        elif status in self.statuses:
+            delay = self._jitter(attempt)
+        else:
+            return None
+
+        if elapsed + delay > self.total_timeout:
+            return None
+        if self.on_retry is not None:
+            self.on_retry(RetryEvent(method, url, attempt + 1, delay, status, error))
+        return delay
+
+    def _jitter(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
@@ -0,0 +1,285 @@
+"""Incremental parsing of result pages, yielding their items while the body is received"""
+
+import re
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from Pexels.errors import PexelsError
+
+STREAM_CHUNK_SIZE: int = 16 * 1024
+"Bytes read from the connection at once by streamed pages."
+
+_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+# everything up to the next bracket, whole strings included, so brackets inside strings are skipped
+_SKIP = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.DOTALL)
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_END = re.compile(rb'[,}\] \t\r\n]')
+_OPEN = frozenset(b'{[')
+_QUOTE = ord('"')
+
+
+def _skip_string(buffer: bytes, pos: int) -> Optional[int]:
+    # `pos` is on the opening quote, returns the position after the closing one
+    match = _STRING_END.match(buffer, pos + 1)
+    return match.end() if match else None
+
+
+class ArrayScanner:
+    """
+    Parse a JSON object received in chunks, returning the elements of one of its arrays as soon as
+    each of them is complete. The other members of the object are decoded into :attr:`envelope`.
+
+    Only the bytes of the element being received are kept, so the whole array never sits in memory.
+
+    .. code:: python
+
+        scanner = ArrayScanner("photos", json.loads)
+        for chunk in response.iter_content(65536):
+            for photo in scanner.feed(chunk):
+                print(photo["id"])
+        scanner.close()
+
+    Args:
+        key (:obj:`str`): The member holding the array to stream, e.g. ``photos``.
+        decode (:obj:`Callable`): Decodes the :obj:`bytes` of one JSON value, see :func:`Pexels.decoders.get_decoder`.
+    """
+
+    envelope: Dict[str, Any]
+    "The members of the object other than the array, decoded as they are received."
+
+    def __init__(self, key: str, decode: Callable[[bytes], Any]):
+
+        self.key = key
+        self.envelope = {}
+        self._decode = decode
+        self._buffer = b''
+        self._pos = 0
+        self._state = 'start'
+        self._member: Optional[str] = None
+        # progress in the object or array being received, so a large value is not rescanned on every chunk
+        self._scanned = 0
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add received bytes.
+
+        Returns:
+            :obj:`list` of the array elements completed by this chunk, decoded.
+
+        Raises:
+            PexelsError: When the body is not a JSON object.
+        """
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        items = []
+        while self._step(items, final=False):
+            pass
+        return items
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body.
+
+        Returns:
+            :obj:`list` of the array elements still buffered, decoded.
+
+        Raises:
+            PexelsError: When the body ended before the object was complete.
+        """
+
+        items = []
+        while self._step(items, final=True):
+            pass
+        if self._state != 'done':
+            raise PexelsError("The response body ended before the end of the JSON object.")
+        return items
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole object was parsed."""
+        return self._state == 'done'
+
+    def _value_end(self, buffer: bytes, start: int, final: bool) -> Optional[int]:
+        # returns the position after the JSON value at `start`, or None when it is not complete yet
+        first = buffer[start]
+        if first == _QUOTE:
+            return _skip_string(buffer, start)
+        if first not in _OPEN:
+            match = _SCALAR_END.search(buffer, start)
+            if match:
+                return match.start()
+            return len(buffer) if final else None
+
+        if self._scanned:
+            pos, depth = start + self._scanned, self._depth
+        else:
+            pos, depth = start + 1, 1
+        while True:
+            pos = _SKIP.match(buffer, pos).end()
+            # the end of the buffer, or a string not received entirely
+            if pos >= len(buffer) or buffer[pos] == _QUOTE:
+                self._scanned, self._depth = pos - start, depth
+                return None
+            depth += 1 if buffer[pos] in _OPEN else -1
+            pos += 1
+            if depth == 0:
+                self._scanned = self._depth = 0
+                return pos
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        # advance by one token, returns False when more bytes are needed
+        buffer = self._buffer
+        pos = _WHITESPACE.match(buffer, self._pos).end()
+        if pos >= len(buffer):
+            self._pos = pos
+            return False
+        char = buffer[pos:pos + 1]
+        state = self._state
+
+        if state == 'start':
+            if char != b'{':
+                raise PexelsError("The response body is not a JSON object.")
+            self._pos, self._state = pos + 1, 'member'
+        elif state == 'member':
+            if char == b'}':
+                self._pos, self._state = pos + 1, 'done'
+                return True
+            if char == b',':
+                self._pos = pos + 1
+                return True
+            if char != b'"':
+                raise PexelsError("The response body is not a valid JSON object.")
+            end = _skip_string(buffer, pos)
+            if end is None:
+                return False
+            colon = _WHITESPACE.match(buffer, end).end()
+            if colon >= len(buffer):
+                return False
+            if buffer[colon:colon + 1] != b':':
+                raise PexelsError("The response body is not a valid JSON object.")
+            self._member = self._decode(buffer[pos:end])
+            self._pos, self._state = colon + 1, 'value'
+        elif state == 'value':
+            if self._member == self.key and char == b'[':
+                self._pos, self._state = pos + 1, 'array'
+                return True
+            end = self._value_end(buffer, pos, final)
+            if end is None:
+                return False
+            self.envelope[self._member] = self._decode(buffer[pos:end])
+            self._pos, self._state = end, 'member'
+        elif state == 'array':
+            if char == b']':
+                self._pos, self._state = pos + 1, 'member'
+                return True
+            if char == b',':
+                self._pos = pos + 1
+                return True
+            end = self._value_end(buffer, pos, final)
+            if end is None:
+                return False
+            items.append(self._decode(buffer[pos:end]))
+            self._pos = end
+        else:
+            return False
+        return True
+
+
+class PageStream(Iterator[Any]):
+    """
+    A page of results whose items are built one at a time while the response body is received.
+
+    Iterate over it to get the items. The other fields of the page, like :attr:`page` or
+    :attr:`total_results`, are available once they are received: those placed after the items
+    in the body are `None` until the iteration finished.
+
+    .. code:: python
+
+        with client.stream_search_videos("Nature", per_page=80) as stream:
+            for video in stream:
+                print(video.id)
+            print(stream.total_results, stream.next_page)
+
+    Note:
+        * The connection is held until the iteration finished or :meth:`close` is called.
+    """
+
+    envelope: Dict[str, Any]
+    "The fields of the page other than its items, decoded as they are received."
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: str,
+        factory: Callable[[Dict[str, Any]], Any],
+        decode: Callable[[bytes], Any],
+        close: Optional[Callable[[], None]] = None
+    ):
+
+        self._scanner = ArrayScanner(key, decode)
+        self.envelope = self._scanner.envelope
+        self._chunks = iter(chunks)
+        self._factory = factory
+        self._close = close
+        self._pending = deque()
+        self._finished = False
+
+    def __next__(self) -> Any:
+        while True:
+            while self._pending:
+                item = self._factory(self._pending.popleft())
+                if item is not None:
+                    return item
+            if self._finished:
+                raise StopIteration
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._pending.extend(self._scanner.close())
+                self._finished = True
+                self.close()
+                continue
+            except BaseException:
+                self.close()
+                raise
+            self._pending.extend(self._scanner.feed(chunk))
+
+    def close(self) -> None:
+        """Release the connection, the remaining items are discarded."""
+
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "PageStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def page(self) -> Optional[int]:
+        "The current page number."
+        return self.envelope.get('page')
+
+    @property
+    def per_page(self) -> Optional[int]:
+        "The number of results returned with each page."
+        return self.envelope.get('per_page')
+
+    @property
+    def total_results(self) -> Optional[int]:
+        "The total number of results for the request."
+        return self.envelope.get('total_results')
+
+    @property
+    def prev_page(self) -> Optional[str]:
+        "URL for the previous page of results, if applicable."
+        return self.envelope.get('prev_page')
+
+    @property
+    def next_page(self) -> Optional[str]:
+        "URL for the next page of results, if applicable."
+        return self.envelope.get('next_page')
@@ -0,0 +1,179 @@
+"""Delta synchronisation of the curated photos and popular videos feeds"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from Pexels.errors import PexelsError
+from Pexels.types import Photo, Video
+
+MAX_IDS: int = 10000
+"Number of most recent ids remembered per feed, enough for several days of new media."
+
+
+class FeedSync:
+    """
+    This object represents the checkpoint of feeds polled for their new media only.
+
+    The feeds are ordered newest first, so a poll fetches pages until one of them holds a media
+    already seen and returns the media not seen before. Between two polls a few media are added
+    every hour, so a poll usually costs one request. The ids seen are saved to `path`, replaced
+    atomically after every poll, so an interrupted job never leaves a broken checkpoint.
+
+    .. code:: python
+
+        sync = FeedSync(client, "~/.cache/pexels-sync.json")
+        for photo in sync.sync_curated_photos():
+            print(photo.id)
+
+    Note:
+        * The first poll of a feed has no checkpoint and stops after `max_pages` pages.
+        * A :class:`Pexels.cache.ResponseCache` of the client serves the feeds until their time to live
+          expired, see :obj:`Pexels.cache.DEFAULT_TTLS`.
+
+    Args:
+        client (:class:`Pexels.client.Client`): The client requesting the feeds.
+        path (:obj:`str`, optional): Path of the checkpoint file, created when missing. Default: kept in memory
+        per_page (:obj:`int`, optional): The number of media requested per page. Default: 80
+        max_pages (:obj:`int`, optional): The maximum number of pages requested per poll. Default: 10
+        max_ids (:obj:`int`, optional): The number of most recent ids remembered per feed. Default: :obj:`MAX_IDS`
+
+    Raises:
+        PexelsError: When the checkpoint file is not valid.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: Optional[str] = None,
+        per_page: int = 80,
+        max_pages: int = 10,
+        max_ids: int = MAX_IDS
+    ):
+
+        self.client = client
+        self.path = os.path.expanduser(path) if path else None
+        self.per_page = per_page
+        self.max_pages = max_pages
+        self.max_ids = max_ids
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)["feeds"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise PexelsError(f"Invalid sync checkpoint {self.path}: {exc}") from exc
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # written next to the checkpoint then renamed over it, so a reader sees the old or the new one
+        fd, temp = tempfile.mkstemp(prefix=".sync-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"feeds": self._feeds}, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def sync_curated_photos(self) -> List[Photo]:
+        """
+        Poll the curated photos, see :meth:`Pexels.client.Client.search_curated_photo`.
+
+        Returns:
+            :obj:`list` of :class:`Pexels.types.Photo` not seen before, newest first.
+        """
+
+        return self._sync(
+            "curated",
+            lambda page: self.client.search_curated_photo(page=page, per_page=self.per_page),
+            "photos"
+        )
+
+    def sync_popular_videos(
+        self,
+        min_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None
+    ) -> List[Video]:
+        """
+        Poll the popular videos, see :meth:`Pexels.client.Client.get_popular_videos`.
+        Every combination of filters has its own checkpoint.
+
+        Args:
+            min_width (:obj:`int`, optional): The minimum width in pixels of the returned videos.
+            min_height (:obj:`int`, optional): The minimum height in pixels of the returned videos.
+            min_duration (:obj:`int`, optional): The minimum duration in seconds of the returned videos.
+            max_duration (:obj:`int`, optional): The maximum duration in seconds of the returned videos.
+
+        Returns:
+            :obj:`list` of :class:`Pexels.types.Video` not seen before, newest first.
+        """
+
+        filters = {
+            'min_width': min_width,
+            'min_height': min_height,
+            'min_duration': min_duration,
+            'max_duration': max_duration,
+        }
+        name = "popular" + "".join(f"&{key}={value}" for key, value in filters.items() if value is not None)
+        return self._sync(
+            name,
+            lambda page: self.client.get_popular_videos(**filters, page=page, per_page=self.per_page),
+            "videos"
+        )
+
+    def _sync(self, name: str, fetch: Callable[[int], Any], items: str) -> List[Any]:
+        with self._lock:
+            known = self._feeds.get(name, {}).get("ids", [])
+            seen = set(known)
+            new = []
+            for page in range(1, self.max_pages + 1):
+                response = fetch(page)
+                reached = False
+                for obj in getattr(response, items):
+                    if obj.id in seen:
+                        reached = True
+                        continue
+                    seen.add(obj.id)
+                    new.append(obj)
+                if reached or not response.next_page:
+                    break
+
+            self._feeds[name] = {"ids": ([obj.id for obj in new] + known)[:self.max_ids], "synced": time.time()}
+            self._save()
+            return new
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        Forget the ids seen, so the next poll starts over.
+
+        Args:
+            name (:obj:`str`, optional): The feed, ``curated`` or ``popular`` followed by its filters. Default: every feed
+        """
+
+        with self._lock:
+            if name is None:
+                self._feeds.clear()
+            else:
+                self._feeds.pop(name, None)
+            self._save()
+
+    @property
+    def feeds(self) -> Dict[str, int]:
+        "The number of ids remembered per feed."
+        with self._lock:
+            return {name: len(feed["ids"]) for name, feed in self._feeds.items()}
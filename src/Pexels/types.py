@@ -1,17 +1,107 @@
-from re import U
-from typing import Any, Dict, List, Optional, Union
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+from Pexels.errors import PexelsError
 
  
 class PexelsType:
     """Base class for all pexels objects"""
- 
+
+    __slots__ = ()
+
+    def _fields(self) -> Dict[str, Any]:
+        fields = dict(getattr(self, '__dict__', {}))
+        for cls in reversed(type(self).__mro__):
+            for name in cls.__dict__.get('__slots__', ()):
+                # private slots back a public property of the same name
+                name = name.lstrip('_')
+                if hasattr(self, name):
+                    fields[name] = getattr(self, name)
+        return fields
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> Any:
+        """
+        Build the object from its decoded JSON, like ``cls(**data)``.
+        The models of the API override it to set their attributes directly,
+        which skips unpacking every dict into keyword arguments.
+
+        Args:
+            data (:obj:`dict`): The decoded JSON object.
+            lazy (:obj:`bool`, optional): Build the nested models on first access. Default: False
+        """
+
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the public fields as JSON compatible dicts and lists, the reverse of :meth:`from_dict`.
+        """
+
+        return {name: _to_json(value) for name, value in self._fields().items()}
+
     def __str__(self) -> str:
-        return f'<{self.__class__.__name__}: {self.__dict__}'
+        return f'<{self.__class__.__name__}: {self._fields()}'
     
     def __repr__(self) -> str:
         return self.__str__()
- 
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, PexelsType):
+        return value.to_dict()
+    if isinstance(value, LazyList):
+        return list(value.raw)
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    return value
+
+
+class LazyList(Sequence):
+    """
+    A list of model objects built from the raw decoded dicts on first access.
+
+    It supports ``len()``, indexing, slicing and iteration like the :obj:`list` it replaces.
+    """
+
+    __slots__ = ('raw', '_factory', '_items')
+
+    raw: List[Dict[str, Any]]
+    "The decoded JSON objects backing the list."
+
+    def __init__(self, raw: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], Any]):
+
+        self.raw = raw
+        self._factory = factory
+        self._items = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._factory(self.raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Src(PexelsType):
+
+    __slots__ = ('original', 'large', 'large2x', 'medium', 'small', 'portrait', 'landscape', 'tiny')
  
     original: str
     "The image without any size changes. It will be the same as the width and height attributes."
@@ -51,9 +141,74 @@ class Src(PexelsType):
         self.portrait = portrait
         self.landscape = landscape
         self.tiny = tiny
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "Src":
+        self = cls.__new__(cls)
+        self.original = data['original']
+        self.large = data['large']
+        self.large2x = data['large2x']
+        self.medium = data['medium']
+        self.small = data['small']
+        self.portrait = data['portrait']
+        self.landscape = data['landscape']
+        self.tiny = data['tiny']
+        return self
+
+    def url_for(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        dpr: int = 1,
+        fit: Optional[str] = None,
+        compress: bool = True
+    ) -> str:
+        """
+        Build the URL of this image resized by the Pexels CDN, without any API call.
+        The other attributes are built the same way, e.g. :attr:`large2x` is ``url_for(940, 650, dpr=2)``.
+
+        .. code:: python
+
+            photo.src.url_for(width=640)
+            photo.src.url_for(width=400, height=400, fit="crop")
+
+        Args:
+            width (:obj:`int`, optional): The width in pixels, proportional to `height` when not given.
+            height (:obj:`int`, optional): The height in pixels, proportional to `width` when not given.
+            dpr (:obj:`int`, optional): Device pixel ratio, multiplies the delivered pixels. Default: 1
+            fit (:obj:`str`, optional): How the image fits both dimensions, e.g. `crop`.
+                Default: scaled to fit inside them
+            compress (:obj:`bool`, optional): Let the CDN pick the format and compression. Default: True
+
+        Returns:
+            :obj:`str`
+
+        Raises:
+            PexelsError: When a dimension or `dpr` is not positive.
+        """
+
+        if (width is not None and width <= 0) or (height is not None and height <= 0) or dpr <= 0:
+            raise PexelsError("width, height and dpr must be positive.")
+
+        params = []
+        if compress:
+            params += [('auto', 'compress'), ('cs', 'tinysrgb')]
+        if dpr != 1:
+            params.append(('dpr', dpr))
+        if fit:
+            params.append(('fit', fit))
+        if height is not None:
+            params.append(('h', height))
+        if width is not None:
+            params.append(('w', width))
+
+        base = urlsplit(self.original)._replace(query='', fragment='').geturl()
+        return f"{base}?{urlencode(params)}" if params else base
  
 class User(PexelsType):
 
+    __slots__ = ('id', 'name', 'url')
+
     id: int
     "The id of the videographer."
     name: str
@@ -67,7 +222,17 @@ class User(PexelsType):
         self.name = name
         self.url = url
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "User":
+        self = cls.__new__(cls)
+        self.id = data['id']
+        self.name = data['name']
+        self.url = data['url']
+        return self
+
 class Photo(PexelsType):
+
+    __slots__ = ('type', 'id', 'width', 'height', 'url', 'photographer', 'photographer_url', 'photographer_id', 'avg_color', '_src', 'alt')
     
     type: str
     "The type of media to be shown in collections."
@@ -105,9 +270,11 @@ class Photo(PexelsType):
         src: Src,
         alt: str,
         type: str = "Photo",
+        lazy: bool = False,
         **kwargs
     ) -> None:
  
+        self.type = type
         self.id = id
         self.width = width
         self.height = height
@@ -116,11 +283,40 @@ class Photo(PexelsType):
         self.photographer_url = photographer_url
         self.photographer_id = photographer_id
         self.avg_color = avg_color
-        self.src = Src(**src)
+        self._src = src if lazy or not isinstance(src, dict) else Src.from_dict(src)
         self.alt = alt
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "Photo":
+        self = cls.__new__(cls)
+        self.type = data.get('type', "Photo")
+        self.id = data['id']
+        self.width = data['width']
+        self.height = data['height']
+        self.url = data['url']
+        self.photographer = data['photographer']
+        self.photographer_url = data['photographer_url']
+        self.photographer_id = data['photographer_id']
+        self.avg_color = data['avg_color']
+        src = data['src']
+        self._src = src if lazy or not isinstance(src, dict) else Src.from_dict(src)
+        self.alt = data['alt']
+        return self
+
+    @property
+    def src(self) -> Src:
+        if isinstance(self._src, dict):
+            self._src = Src.from_dict(self._src)
+        return self._src
+
+    @src.setter
+    def src(self, src: Src) -> None:
+        self._src = src
  
 class VideoFiles(PexelsType):
 
+    __slots__ = ('id', 'quality', 'file_type', 'width', 'height', 'link')
+
     id: int
     "The id of the `video_file`"
     quality: str
@@ -152,8 +348,21 @@ class VideoFiles(PexelsType):
         self.height = height
         self.link = link
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "VideoFiles":
+        self = cls.__new__(cls)
+        self.id = data['id']
+        self.quality = data['quality']
+        self.file_type = data['file_type']
+        self.width = data['width']
+        self.height = data['height']
+        self.link = data['link']
+        return self
+
 class VideoPicture(PexelsType):
 
+    __slots__ = ('id', 'picture', 'nr')
+
     id: int
     "The id of the `video_picture`"
     picture: str
@@ -164,7 +373,15 @@ class VideoPicture(PexelsType):
 
         self.id = id
         self.picture = picture
-        self.nr = nr 
+        self.nr = nr
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "VideoPicture":
+        self = cls.__new__(cls)
+        self.id = data['id']
+        self.picture = data['picture']
+        self.nr = data['nr']
+        return self
 
 class PhotoResponse(PexelsType):
  
@@ -189,17 +406,123 @@ class PhotoResponse(PexelsType):
         total_results: int,
         prev_page: str = "",
         next_page: str = "",
+        lazy: bool = False,
         **kwargs
         ):
         #assign photos dict to self.photos
-        self.photos = [Photo(**photo) for photo in photos]
+        if lazy:
+            self.photos = LazyList(photos, _lazy_photo)
+        else:
+            self.photos = [Photo.from_dict(photo) for photo in photos]
         self.page = page
         self.per_page = per_page
         self.total_results = total_results
         self.prev_page = prev_page
         self.next_page = next_page
 
-class Video:
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "PhotoResponse":
+        self = cls.__new__(cls)
+        photos = data['photos']
+        self.photos = LazyList(photos, _lazy_photo) if lazy else [Photo.from_dict(photo) for photo in photos]
+        self.page = data['page']
+        self.per_page = data['per_page']
+        self.total_results = data['total_results']
+        self.prev_page = data.get('prev_page', "")
+        self.next_page = data.get('next_page', "")
+        return self
+
+class RenditionIndex:
+    """
+    The renditions of a :class:`Video`, grouped by quality and file type and sorted by size,
+    to pick a :class:`VideoFiles` without scanning the whole list.
+
+    .. code:: python
+
+        video.renditions.at_least(width=1280, file_type="video/mp4")
+        video.renditions.nearest(height=1080, quality="hd")
+
+    Note:
+        * `quality` and `file_type` filter the renditions, `None` accepts any value.
+
+        * Renditions without width or height are only returned when no dimension is requested.
+    """
+
+    __slots__ = ('_groups',)
+
+    def __init__(self, video_files: List["VideoFiles"]):
+
+        self._groups: Dict[Tuple[Optional[str], Optional[str]], Tuple[List[int], List["VideoFiles"]]] = {}
+        groups: Dict[Tuple[Optional[str], Optional[str]], List["VideoFiles"]] = {}
+        for video_file in video_files:
+            for key in (
+                (video_file.quality, video_file.file_type),
+                (video_file.quality, None),
+                (None, video_file.file_type),
+                (None, None),
+            ):
+                groups.setdefault(key, []).append(video_file)
+        for key, files in groups.items():
+            files.sort(key=lambda f: (f.width or 0, f.height or 0))
+            self._groups[key] = ([f.width or 0 for f in files], files)
+
+    def select(self, quality: Optional[str] = None, file_type: Optional[str] = None) -> List["VideoFiles"]:
+        """Return the renditions of a quality and file type, smallest first."""
+        return list(self._groups.get((quality, file_type), ((), []))[1])
+
+    def at_least(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        quality: Optional[str] = None,
+        file_type: Optional[str] = None
+    ) -> Optional["VideoFiles"]:
+        """
+        Return the smallest rendition at least `width` wide and `height` high.
+
+        Returns:
+            :class:`VideoFiles` or `None` when no rendition is large enough.
+        """
+
+        widths, files = self._groups.get((quality, file_type), ((), []))
+        for video_file in files[bisect_left(widths, width or 0):]:
+            if height is None or (video_file.height or 0) >= height:
+                return video_file
+        return None
+
+    def nearest(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        quality: Optional[str] = None,
+        file_type: Optional[str] = None
+    ) -> Optional["VideoFiles"]:
+        """
+        Return the rendition whose dimensions are the closest to `width` and `height`,
+        the larger one on a tie.
+
+        Returns:
+            :class:`VideoFiles` or `None` when no rendition matches `quality` and `file_type`.
+        """
+
+        widths, files = self._groups.get((quality, file_type), ((), []))
+        if not files:
+            return None
+        return min(
+            reversed(files),
+            key=lambda f: (abs((f.width or 0) - width) if width is not None else 0)
+            + (abs((f.height or 0) - height) if height is not None else 0)
+        )
+
+    def largest(self, quality: Optional[str] = None, file_type: Optional[str] = None) -> Optional["VideoFiles"]:
+        """Return the largest rendition of a quality and file type, or `None`."""
+
+        files = self._groups.get((quality, file_type), ((), []))[1]
+        return files[-1] if files else None
+
+class Video(PexelsType):
+
+    __slots__ = ('type', 'id', 'width', 'height', 'url', 'image', 'duration', 'user', 'video_files', 'video_pictures', '_rendition_index')
     
     type: str
     "The type of this media to be shown collections."
@@ -234,6 +557,7 @@ class Video:
         video_files: List[VideoFiles],
         video_pictures: List[VideoPicture],
         type: str = "Video",
+        lazy: bool = False,
         **kwargs
     ):
         self.type = type
@@ -244,8 +568,40 @@ class Video:
         self.image = image
         self.duration = duration
         self.user = user
-        self.video_files = [VideoFiles(**vid_file) for vid_file in video_files]
-        self.video_pictures = [VideoPicture(**vid_pic) for vid_pic in video_pictures]
+        if lazy:
+            self.video_files = LazyList(video_files, VideoFiles.from_dict)
+            self.video_pictures = LazyList(video_pictures, VideoPicture.from_dict)
+        else:
+            self.video_files = [VideoFiles.from_dict(vid_file) for vid_file in video_files]
+            self.video_pictures = [VideoPicture.from_dict(vid_pic) for vid_pic in video_pictures]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "Video":
+        self = cls.__new__(cls)
+        self.type = data.get('type', "Video")
+        self.id = data['id']
+        self.width = data['width']
+        self.height = data['height']
+        self.url = data['url']
+        self.image = data['image']
+        self.duration = data['duration']
+        self.user = data['user']
+        video_files, video_pictures = data['video_files'], data['video_pictures']
+        if lazy:
+            self.video_files = LazyList(video_files, VideoFiles.from_dict)
+            self.video_pictures = LazyList(video_pictures, VideoPicture.from_dict)
+        else:
+            self.video_files = [VideoFiles.from_dict(vid_file) for vid_file in video_files]
+            self.video_pictures = [VideoPicture.from_dict(vid_pic) for vid_pic in video_pictures]
+        return self
+
+    @property
+    def renditions(self) -> RenditionIndex:
+        """Index of :attr:`video_files`, built on first access and again after :attr:`video_files` is replaced."""
+        index = getattr(self, '_rendition_index', None)
+        if index is None or index[0] is not self.video_files:
+            index = self._rendition_index = (self.video_files, RenditionIndex(self.video_files))
+        return index[1]
 
 class VideoResponse(PexelsType):
 
@@ -273,10 +629,14 @@ class VideoResponse(PexelsType):
         total_results: int,
         prev_page: Optional[str] = "",
         next_page: Optional[str] = "",
+        lazy: bool = False,
         **kwargs
     ):
 
-        self.videos = [Video(**video) for video in videos]
+        if lazy:
+            self.videos = LazyList(videos, _lazy_video)
+        else:
+            self.videos = [Video.from_dict(video) for video in videos]
         self.url = url
         self.page = page
         self.per_page = per_page
@@ -284,6 +644,46 @@ class VideoResponse(PexelsType):
         self.prev_page = prev_page
         self.next_page = next_page
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "VideoResponse":
+        self = cls.__new__(cls)
+        videos = data['videos']
+        self.videos = LazyList(videos, _lazy_video) if lazy else [Video.from_dict(video) for video in videos]
+        self.url = data['url']
+        self.page = data['page']
+        self.per_page = data['per_page']
+        self.total_results = data['total_results']
+        self.prev_page = data.get('prev_page', "")
+        self.next_page = data.get('next_page', "")
+        return self
+
+    def select_renditions(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        quality: Optional[str] = None,
+        file_type: Optional[str] = None,
+        nearest: bool = False
+    ) -> List[Optional[VideoFiles]]:
+        """
+        Pick one rendition per video of this page, see :class:`RenditionIndex`.
+
+        Args:
+            width (:obj:`int`, optional): The wanted width in pixels.
+            height (:obj:`int`, optional): The wanted height in pixels.
+            quality (:obj:`str`, optional): Only consider renditions of this quality, e.g. `hd`.
+            file_type (:obj:`str`, optional): Only consider renditions of this format, e.g. `video/mp4`.
+            nearest (:obj:`bool`, optional): Pick the closest rendition instead of the smallest one
+                at least as large. Default: False
+
+        Returns:
+            A :class:`VideoFiles` or `None` per video, in the order of :attr:`videos`.
+        """
+
+        if nearest:
+            return [video.renditions.nearest(width, height, quality, file_type) for video in self.videos]
+        return [video.renditions.at_least(width, height, quality, file_type) for video in self.videos]
+
 class Collection(PexelsType):
 
     id: str
@@ -321,6 +721,18 @@ class Collection(PexelsType):
         self.photos_count = photos_count
         self.videos_count = videos_count
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "Collection":
+        self = cls.__new__(cls)
+        self.id = data['id']
+        self.title = data['title']
+        self.description = data['description']
+        self.private = data['private']
+        self.media_count = data['media_count']
+        self.photos_count = data['photos_count']
+        self.videos_count = data['videos_count']
+        return self
+
 class CollectionResponse(PexelsType):
 
     collections: List[Collection]
@@ -344,16 +756,35 @@ class CollectionResponse(PexelsType):
         total_results: int,
         prev_page: Optional[str] = "",
         next_page: Optional[str] = "",
+        lazy: bool = False,
         **kwargs
     ):
 
-        self.collections = [Collection(**collection) for collection in collections]
+        if lazy:
+            self.collections = LazyList(collections, Collection.from_dict)
+        else:
+            self.collections = [Collection.from_dict(collection) for collection in collections]
         self.page = page
         self.per_page = per_page
         self.total_results = total_results
         self.prev_page = prev_page
         self.next_page = next_page
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "CollectionResponse":
+        self = cls.__new__(cls)
+        collections = data['collections']
+        if lazy:
+            self.collections = LazyList(collections, Collection.from_dict)
+        else:
+            self.collections = [Collection.from_dict(collection) for collection in collections]
+        self.page = data['page']
+        self.per_page = data['per_page']
+        self.total_results = data['total_results']
+        self.prev_page = data.get('prev_page', "")
+        self.next_page = data.get('next_page', "")
+        return self
+
 class CollectionMediaResponse(PexelsType):
 
     id: str
@@ -380,21 +811,44 @@ class CollectionMediaResponse(PexelsType):
         total_results: int,
         prev_page: Optional[str] = "",
         next_page: Optional[str] = "",
+        lazy: bool = False,
         **kwargs
     ):
 
         self.id = id
-        self.media = []
-        for _media in media:
-            if _media["type"] == "Photo":
-                self.media.append(Photo(**_media))
-            elif _media["type"] == "Video":
-                self.media.append(Video(**_media))
-            else:
-                pass
-        
+        self.media = _build_media(media, lazy)
         self.page = page
         self.per_page = per_page
         self.total_results = total_results
         self.prev_page = prev_page
-        self.next_page = next_page
\ No newline at end of file
+        self.next_page = next_page
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "CollectionMediaResponse":
+        self = cls.__new__(cls)
+        self.id = data['id']
+        self.media = _build_media(data['media'], lazy)
+        self.page = data['page']
+        self.per_page = data['per_page']
+        self.total_results = data['total_results']
+        self.prev_page = data.get('prev_page', "")
+        self.next_page = data.get('next_page', "")
+        return self
+
+_MEDIA_TYPES = {"Photo": Photo, "Video": Video}
+
+
+def _lazy_photo(data: Dict[str, Any]) -> Photo:
+    return Photo.from_dict(data, lazy=True)
+
+
+def _lazy_video(data: Dict[str, Any]) -> Video:
+    return Video.from_dict(data, lazy=True)
+
+
+def _build_media(media: List[Dict[str, Any]], lazy: bool) -> Union[List[Union[Photo, Video]], LazyList]:
+    # media of another type are skipped
+    media = [_media for _media in media if _media["type"] in _MEDIA_TYPES]
+    if lazy:
+        return LazyList(media, lambda _media: _MEDIA_TYPES[_media["type"]].from_dict(_media, lazy=True))
+    return [_MEDIA_TYPES[_media["type"]].from_dict(_media) for _media in media]